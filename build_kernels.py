@@ -0,0 +1,46 @@
+"""
+Ahead-of-time build of Neon Dodge's numeric kernels.
+
+Run once after installing numba:   python build_kernels.py
+
+This compiles the njit kernels from neon_dodge.py into a native extension
+module ``neon_kernels`` next to the game. When it is present the game imports
+the kernels from it and skips JIT compilation on startup; the extension only
+needs NumPy at runtime. Without it the game falls back to the njit (or plain
+Python) kernels in neon_dodge.py.
+
+The extension records the CRC of the kernel source it was built from, and the
+game ignores it once the kernels in neon_dodge.py change; run the build again
+to pick the edits up. Signatures must match the dtypes of the pool arrays the
+game passes in.
+"""
+
+from pathlib import Path
+
+from numba.pycc import CC
+
+import neon_dodge as nd
+
+cc = CC("neon_kernels")
+cc.output_dir = str(Path(__file__).resolve().parent)
+
+cc.export(
+    "build_enemy_grid",
+    "void(f4[:], f4[:], f4[:], f8, f8, i8, i8, i4[:], i4[:], i4[:])",
+)(nd.JIT_KERNELS["build_enemy_grid"].py_func)
+cc.export(
+    "resolve_bullet_hits",
+    "i8(f4[:], f4[:], f8, i4[:], i4[:], b1[:], b1[:], f4[:], f4[:], f4[:], i4[:], f8, i8, i8, i4[:], i4[:])",
+)(nd.JIT_KERNELS["resolve_bullet_hits"].py_func)
+cc.export(
+    "step_enemies",
+    "i8(f4[:], f4[:], f4[:], f4[:], f4[:], f4[:], b1[:], i4[:], f4[:], i1[:], i8, f4[:],"
+    " f8, f8, f8, f8, f8, f8, f4[:, :])",
+)(nd.JIT_KERNELS["step_enemies"].py_func)
+
+source_crc = nd.kernel_source_crc()
+cc.export("kernels_version", "i8()")(lambda: source_crc)
+
+
+if __name__ == "__main__":
+    cc.compile()
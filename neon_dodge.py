@@ -3,7 +3,9 @@ Neon Dodge — Pygame (single file)
 AUTO-SHOOT • POWER-UPS • COINS • SHOP • BOSSES • KILL COUNT
 
 How to run:
-1) Install Python 3.10+ and Pygame:    pip install pygame
+1) Install Python 3.10+, Pygame, NumPy: pip install pygame numpy
+   (optional, faster collision kernels:  pip install numba
+    and, to skip the JIT warm-up on startup:  python build_kernels.py)
 2) Save this file as neon_dodge.py
 3) Run:                                python neon_dodge.py
 
@@ -25,27 +27,46 @@ Upgrades in Shop (costs rise as you buy):
 
 This file is structured for easy modding:
 - GameState finite-state machine (TITLE, PLAYING, GAME_OVER)
-- Player / Enemy / Orb / Bullet / PowerUp classes + simple Boss flag
+- Player / Enemy / Orb / PowerUp classes + simple Boss flag
+- Bullets, enemies and particles live in pools of parallel NumPy arrays
+  (BulletPool, EnemyPool, ParticlePool) so per-frame updates run vectorized
+  or in njit kernels
 - Auto-shooting, power-ups, upgrades shop, coins, bosses, kill count
 - Delta-time movement; difficulty ramp; screen shake; simple persistence (high score)
 """
 
 from __future__ import annotations
+import inspect
 import json
 import math
 import random
+import zlib
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from enum import Enum, auto
 from pathlib import Path
-from typing import List, Tuple, Optional
+from typing import Callable, List, Tuple, Optional
 
+import numpy as np
 import pygame
 from pygame import Surface
 from pygame.math import Vector2 as V2
 
+try:
+    from numba import njit
+except ImportError:  # numba is optional; kernels then run as plain Python
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda fn: fn
+
 # ---------------------------- Config & Constants ---------------------------- #
 WIDTH, HEIGHT = 900, 600
-FPS = 120
+CX, CY = WIDTH / 2, HEIGHT / 2  # screen centre; both rebound in Game.__init__
+FPS = 60  # render rate
+MENU_FPS = 30  # frame cap outside gameplay
+PHYSICS_DT = 1.0 / 120  # fixed gameplay step, decoupled from FPS (see Game.run)
+MAX_PHYSICS_STEPS = 8  # per frame; a longer stall is dropped, not replayed
 TITLE = "Neon Dodge"
 SAVE_PATH = Path("neon_dodge_save.json")
 
@@ -61,17 +82,45 @@ GREY = (120, 130, 140)
 BLUE = (120, 180, 255)
 ORANGE = (255, 150, 80)
 
+EXPLOSION_COLORS = [
+    (255, 0, 0),
+    (255, 127, 0),
+    (255, 255, 0),
+    (0, 255, 0),
+    (0, 0, 255),
+    (75, 0, 130),
+    (148, 0, 211),
+]
+
+# Unit directions of the mega boss's 8-way bullet ring
+_RING8_C = np.cos(np.arange(8) * (math.tau / 8)).astype(np.float32)
+_RING8_S = np.sin(np.arange(8) * (math.tau / 8)).astype(np.float32)
+
 # Gameplay
 PLAYER_BASE_SPEED = 320.0
 # make player easier to see
 PLAYER_RADIUS = 20
 PLAYER_IFRAMES = 1.0
 PLAYER_FRICTION = 10.0
+# Held movement keys as bits (see movement_mask); MOVE_DIRS maps every mask
+# to its unit direction, diagonals already normalized
+MOVE_RIGHT, MOVE_LEFT, MOVE_DOWN, MOVE_UP = 1, 2, 4, 8
+MOVE_DIRS = []
+for _mask in range(16):
+    _dx = bool(_mask & MOVE_RIGHT) - bool(_mask & MOVE_LEFT)
+    _dy = bool(_mask & MOVE_DOWN) - bool(_mask & MOVE_UP)
+    _len = math.hypot(_dx, _dy)
+    MOVE_DIRS.append((_dx / _len, _dy / _len) if _len else (0.0, 0.0))
+del _mask, _dx, _dy, _len
 
 ENEMY_BASE_SPEED = 120.0
 ENEMY_RADIUS = 16
 ENEMY_SPAWN_COOLDOWN = 0.4
 ENEMY_MAX = 50
+ENEMY_GRID_CELL = 48  # broadphase cell size in pixels
+ENEMY_GRID_MIN = 16  # fewer enemies than this share one cell (brute force)
+TEXT_CACHE_MAX = 128  # rendered text surfaces kept by Game.text
+NOISE_ROWS = 4096  # rows in the per-frame noise table (see Game._noise_rows)
 
 ORB_RADIUS = 8
 ORB_SCORE = 10
@@ -84,13 +133,27 @@ BULLET_LIFETIME = 2.0
 BULLET_BASE_DMG = 1
 FIRE_COOLDOWN = 0.35
 ENEMY_BULLET_SPEED = 300.0
+# Fire patterns by spread level, as (cos, sin) rotations of the aim; 0° is
+# the aimed shot
+SPREAD_DIRS = {
+    level: [(math.cos(r), math.sin(r)) for r in map(math.radians, angles)]
+    for level, angles in ((0, (0,)), (1, (0, 10, -10)), (2, (0, 8, -8, 16, -16)))
+}
 
 POWERUP_RADIUS = 12
 POWERUP_SPAWN_MIN = 10.0
 POWERUP_SPAWN_MAX = 16.0
 POWERUP_DURATION = 10.0
+LOW_TICK = 0.1  # seconds between Game._tick_low updates
+# Slots in Game._timers; the fire-pattern power-ups come first (see update_play)
+T_RAPID, T_SPREAD, T_PIERCE, T_SPEED = range(4)
+BADGE_NAMES = ("Rapid", "Spread", "Pierce", "Speed")  # HUD label per slot
 SHIELD_RECHARGE_RATE = 1.0  # seconds of charge regained per second
 
+# Squared pickup distances for the player's inline overlap tests
+_R2_PLAYER_ORB = (PLAYER_RADIUS + ORB_RADIUS) ** 2
+_R2_PLAYER_PU = (PLAYER_RADIUS + POWERUP_RADIUS) ** 2
+
 LIVES_START = 3
 BAR_WIDTH = 180
 BAR_HEIGHT = 16
@@ -110,7 +173,8 @@ XP_ORB = 5
 
 random.seed()
 
-# sprite helper
+# Sprite helpers. All of them need the display mode set: every returned surface
+# is converted to the display's pixel format so blits never convert per pixel.
 def load_sprite(path: str, diameter: int, color: Tuple[int, int, int]) -> Surface:
     try:
         # Scale any loaded image down to the requested diameter so oversized
@@ -122,7 +186,46 @@ def load_sprite(path: str, diameter: int, color: Tuple[int, int, int]) -> Surfac
         # If the image can't be loaded, fall back to a simple colored circle
         surf = pygame.Surface((diameter, diameter), pygame.SRCALPHA)
         pygame.draw.circle(surf, color, (diameter // 2, diameter // 2), diameter // 2)
-        return surf
+        return surf.convert_alpha()
+
+
+def circle_sprite(color: Tuple[int, int, int], radius: int) -> Surface:
+    """Pre-rendered filled circle, blitted at ``(x - radius, y - radius)``."""
+    surf = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+    pygame.draw.circle(surf, color, (radius, radius), radius)
+    return surf.convert_alpha()
+
+
+def ringed_sprite(img: Surface, ring_radius: int, color: Tuple[int, int, int], width: int = 2) -> Surface:
+    """``img`` centred on a square canvas with an outline circle of ``ring_radius`` baked in."""
+    size = max(img.get_width(), img.get_height(), 2 * ring_radius + 2)
+    surf = pygame.Surface((size, size), pygame.SRCALPHA)
+    center = (size // 2, size // 2)
+    surf.blit(img, img.get_rect(center=center))
+    pygame.draw.circle(surf, color, center, ring_radius, width=width)
+    return surf.convert_alpha()
+
+
+def pack_atlas(sprites: dict, width: int = 512, pad: int = 1) -> Tuple[Surface, dict]:
+    """Shelf-pack ``sprites`` into one SRCALPHA surface.
+
+    Returns the atlas and a dict mapping each key to its source ``Rect``, for
+    ``blit(atlas, dest, rect)``. Tallest sprites are placed first so shelves
+    stay tight; ``width`` must fit the widest sprite.
+    """
+    rects = {}
+    x = y = shelf = 0
+    for key in sorted(sprites, key=lambda k: sprites[k].get_height(), reverse=True):
+        w, h = sprites[key].get_size()
+        if x and x + w > width:
+            x, y, shelf = 0, y + shelf + pad, 0
+        rects[key] = pygame.Rect(x, y, w, h)
+        x += w + pad
+        shelf = max(shelf, h)
+    atlas = pygame.Surface((width, y + shelf), pygame.SRCALPHA)
+    for key, rect in rects.items():
+        atlas.blit(sprites[key], rect)
+    return atlas.convert_alpha(), rects
 
 
 def load_sound(path: str) -> Optional[pygame.mixer.Sound]:
@@ -138,11 +241,244 @@ def clamp(x: float, lo: float, hi: float) -> float:
     return max(lo, min(hi, x))
 
 
-def circle_collision(a_pos: V2, a_r: float, b_pos: V2, b_r: float) -> bool:
-    return a_pos.distance_squared_to(b_pos) <= (a_r + b_r) ** 2
+def movement_mask(keys: pygame.key.ScancodeWrapper) -> int:
+    """Pack the held WASD/arrow keys into ``MOVE_*`` bits."""
+    return (
+        (keys[pygame.K_d] or keys[pygame.K_RIGHT]) * MOVE_RIGHT
+        | (keys[pygame.K_a] or keys[pygame.K_LEFT]) * MOVE_LEFT
+        | (keys[pygame.K_s] or keys[pygame.K_DOWN]) * MOVE_DOWN
+        | (keys[pygame.K_w] or keys[pygame.K_UP]) * MOVE_UP
+    )
+
+
+# ------------------------------ Kernels ------------------------------------ #
+@njit(cache=True)
+def grid_cell(v, cell, count):
+    c = int(math.floor(v / cell))
+    return min(max(c, 0), count - 1)
+
+
+@njit(cache=True)
+def build_enemy_grid(ex, ey, er, pad, cell, gw, gh, start, fill, items):
+    """Counting-sort enemies into a uniform grid of ``gw * gh`` cells.
+
+    Each enemy goes into every cell overlapped by the bounding box of its
+    radius plus ``pad``, so a point query only needs its own cell. Cell ``c``
+    holds ``items[start[c]:start[c + 1]]`` in ascending enemy order.
+    ``fill`` is caller-owned scratch of the same length as ``start``.
+    """
+    start[:] = 0
+    for j in range(ex.shape[0]):
+        reach = er[j] + pad
+        x0 = grid_cell(ex[j] - reach, cell, gw)
+        x1 = grid_cell(ex[j] + reach, cell, gw)
+        y0 = grid_cell(ey[j] - reach, cell, gh)
+        y1 = grid_cell(ey[j] + reach, cell, gh)
+        for cy in range(y0, y1 + 1):
+            for cx in range(x0, x1 + 1):
+                start[cy * gw + cx + 1] += 1
+    for c in range(gw * gh):
+        start[c + 1] += start[c]
+    fill[:] = start
+    for j in range(ex.shape[0]):
+        reach = er[j] + pad
+        x0 = grid_cell(ex[j] - reach, cell, gw)
+        x1 = grid_cell(ex[j] + reach, cell, gw)
+        y0 = grid_cell(ey[j] - reach, cell, gh)
+        y1 = grid_cell(ey[j] + reach, cell, gh)
+        for cy in range(y0, y1 + 1):
+            for cx in range(x0, x1 + 1):
+                c = cy * gw + cx
+                items[fill[c]] = j
+                fill[c] += 1
+
+
+@njit(cache=True, fastmath=True)
+def resolve_bullet_hits(bx, by, br, bdmg, bpierce, keep, from_enemy, ex, ey, er, ehp, cell, gw, gh, start, items):
+    """Resolve player bullets against enemies; returns the number of hits.
+
+    Each bullet only tests the enemies bucketed in its grid cell (see
+    ``build_enemy_grid``), in ascending enemy order like the original nested
+    loop. Enemy HP (``ehp``) and bullet pierce are decremented in place and a
+    bullet that runs out of pierce is cleared in ``keep``. Enemies are never
+    removed here: one that drops to ``ehp <= 0`` is skipped by later bullets,
+    and the caller compacts the pool once afterwards.
+    """
+    nh = 0
+    for i in range(bx.shape[0]):
+        if not keep[i] or from_enemy[i]:
+            continue
+        c = grid_cell(by[i], cell, gh) * gw + grid_cell(bx[i], cell, gw)
+        for k in range(start[c], start[c + 1]):
+            j = items[k]
+            if ehp[j] <= 0:
+                continue
+            r = br + er[j]
+            dx = bx[i] - ex[j]
+            if dx > r or dx < -r:
+                continue
+            dy = by[i] - ey[j]
+            if dx * dx + dy * dy <= r * r:
+                ehp[j] -= bdmg[i]
+                nh += 1
+                if bpierce[i] > 0:
+                    bpierce[i] -= 1
+                else:
+                    keep[i] = False
+                    break
+    return nh
+
+
+@njit(cache=True, fastmath=True)
+def step_enemies(
+    px, py, vx, vy, speed, radius, is_boss, tier, dash_cd, kind, zig_kind, zigzag_phase,
+    player_x, player_y, player_r, dt, width, height, rand,
+):
+    """Steer, move, wall-bounce and sway every enemy in one pass over the pool.
+
+    ``rand`` holds one row of uniforms in ``[-1, 1)`` per enemy: two for the
+    steering jitter and one to reroll the dash cooldown. Enemies whose
+    ``kind`` equals ``zig_kind`` also sway sideways. Returns the index of the
+    first enemy overlapping the player circle after the step, or -1.
+    """
+    hit = -1
+    # Velocity blend factors are frame constants; bosses turn slower
+    k_enemy = min(max(4.0 * dt, 0.0), 1.0)
+    k_boss = min(max(2.0 * dt, 0.0), 1.0)
+    for j in range(px.shape[0]):
+        tx = player_x - px[j]
+        ty = player_y - py[j]
+        dist_sq = tx * tx + ty * ty
+        desired_x = 0.0
+        desired_y = 0.0
+        if dist_sq > 1e-4:
+            scale = speed[j] / math.sqrt(dist_sq)
+            desired_x = tx * scale
+            desired_y = ty * scale
+        jitter = speed[j] * (0.15 if is_boss[j] else 0.25)
+        steer_x = desired_x + rand[j, 0] * jitter
+        steer_y = desired_y + rand[j, 1] * jitter
+        k = k_boss if is_boss[j] else k_enemy
+        vx[j] += (steer_x - vx[j]) * k
+        vy[j] += (steer_y - vy[j]) * k
+        px[j] += vx[j] * dt
+        py[j] += vy[j] * dt
+        # Branchless wall bounce: flip a velocity component heading out of
+        # bounds by multiplying with +1/-1, so the loop has no jumps here
+        r = radius[j]
+        flip_x = ((px[j] < r) & (vx[j] < 0)) | ((px[j] > width - r) & (vx[j] > 0))
+        flip_y = ((py[j] < r) & (vy[j] < 0)) | ((py[j] > height - r) & (vy[j] > 0))
+        vx[j] *= 1.0 - 2.0 * flip_x
+        vy[j] *= 1.0 - 2.0 * flip_y
+        px[j] = min(max(px[j], r), width - r)
+        py[j] = min(max(py[j], r), height - r)
+        if tier[j] >= 1:
+            dash_cd[j] -= dt
+            if dash_cd[j] <= 0:
+                if dist_sq > 0:
+                    boost = speed[j] * (1.5 + 0.5 * tier[j]) / math.sqrt(dist_sq)
+                    vx[j] += tx * boost
+                    vy[j] += ty * boost
+                dash_cd[j] = 2.25 + 0.75 * rand[j, 2]
+        if kind[j] == zig_kind:
+            # Sway sideways, perpendicular to the current heading
+            zigzag_phase[j] += dt * 4.0
+            vel_sq = vx[j] * vx[j] + vy[j] * vy[j]
+            if vel_sq > 0:
+                sway = math.sin(zigzag_phase[j]) * speed[j] * (0.5 * dt) / math.sqrt(vel_sq)
+                px[j] -= vy[j] * sway
+                py[j] += vx[j] * sway
+        if hit < 0:
+            dx = px[j] - player_x
+            dy = py[j] - player_y
+            reach = r + player_r
+            if dx * dx + dy * dy <= reach * reach:
+                hit = j
+    return hit
+
+
+# The kernels build_kernels.py compiles, by name. The AOT import below rebinds
+# the module-level names, so the build reads the njit originals from here.
+JIT_KERNELS = {
+    "build_enemy_grid": build_enemy_grid,
+    "resolve_bullet_hits": resolve_bullet_hits,
+    "step_enemies": step_enemies,
+}
+
+
+def kernel_source_crc() -> Optional[int]:
+    """CRC of the kernel source; AOT builds record it to detect staleness."""
+    try:
+        src = "".join(inspect.getsource(getattr(k, "py_func", k)) for k in (grid_cell, *JIT_KERNELS.values()))
+    except OSError:  # no source to compare a build against
+        return None
+    return zlib.crc32(src.encode())
+
+
+try:  # AOT-built kernels (python build_kernels.py) skip the JIT warm-up
+    import neon_kernels
+except ImportError:
+    neon_kernels = None
+# Builds from other kernel source, or from before this check, are stale
+if neon_kernels is not None and getattr(neon_kernels, "kernels_version", lambda: -1)() == kernel_source_crc():
+    from neon_kernels import build_enemy_grid, resolve_bullet_hits, step_enemies
 
 
 # ------------------------------ Entities ----------------------------------- #
+class SoAPool:
+    """Entities stored as parallel NumPy arrays (structure of arrays).
+
+    Subclasses list their columns in ``FIELDS``. Live entries occupy slots
+    ``[0, n)``; ``compact`` keeps survivors contiguous and in order, so every
+    per-frame pass is one vectorized op over a slice.
+    """
+
+    FIELDS: dict = {}
+
+    def __init__(self, capacity: int):
+        self.n = 0
+        self._alloc(capacity)
+
+    def _alloc(self, capacity: int) -> None:
+        for name, dtype in self.FIELDS.items():
+            arr = np.empty(capacity, dtype)
+            if hasattr(self, name):
+                arr[: self.n] = getattr(self, name)[: self.n]
+            setattr(self, name, arr)
+        self.capacity = capacity
+
+    def _claim(self, count: int = 1) -> int:
+        """Reserve ``count`` slots at the tail, growing the arrays if needed.
+
+        Returns the index of the first reserved slot.
+        """
+        need = self.n + count
+        if need > self.capacity:
+            capacity = self.capacity
+            while capacity < need:
+                capacity *= 2
+            self._alloc(capacity)
+        first, self.n = self.n, need
+        return first
+
+    def __len__(self) -> int:
+        return self.n
+
+    def clear(self) -> None:
+        self.n = 0
+
+    def compact(self, keep: np.ndarray) -> None:
+        """Drop every entry whose ``keep`` flag is False, preserving order."""
+        n = self.n
+        k = int(np.count_nonzero(keep))
+        if k == n:
+            return
+        for name in self.FIELDS:
+            arr = getattr(self, name)
+            arr[:k] = arr[:n][keep]
+        self.n = k
+
+
 @dataclass
 class Player:
     pos: V2
@@ -166,16 +502,17 @@ class Player:
     def speed(self) -> float:
         return self.base_speed * self.speed_mult
 
-    def update(self, dt: float, keys: pygame.key.ScancodeWrapper) -> None:
-        dir_x = (keys[pygame.K_d] or keys[pygame.K_RIGHT]) - (keys[pygame.K_a] or keys[pygame.K_LEFT])
-        dir_y = (keys[pygame.K_s] or keys[pygame.K_DOWN]) - (keys[pygame.K_w] or keys[pygame.K_UP])
-        move = V2(float(dir_x), float(dir_y))
-        if move.length_squared() > 0:
-            move = move.normalize() * self.speed()
-        self.vel += (move - self.vel) * clamp(PLAYER_FRICTION * dt, 0.0, 1.0)
-        self.pos += self.vel * dt
-        self.pos.x = clamp(self.pos.x, self.radius, WIDTH - self.radius)
-        self.pos.y = clamp(self.pos.y, self.radius, HEIGHT - self.radius)
+    def update(self, dt: float, move: int) -> None:
+        """Advance one step; ``move`` is a ``movement_mask`` of the held keys."""
+        dir_x, dir_y = MOVE_DIRS[move]
+        speed = self.speed()
+        move_x, move_y = dir_x * speed, dir_y * speed
+        k = clamp(PLAYER_FRICTION * dt, 0.0, 1.0)
+        vel, pos = self.vel, self.pos
+        vel.x += (move_x - vel.x) * k
+        vel.y += (move_y - vel.y) * k
+        pos.x = clamp(pos.x + vel.x * dt, self.radius, WIDTH - self.radius)
+        pos.y = clamp(pos.y + vel.y * dt, self.radius, HEIGHT - self.radius)
 
         if self.iframes > 0:
             self.iframes = max(0.0, self.iframes - dt)
@@ -192,14 +529,18 @@ class Player:
             self.xp -= self.xp_to_next()
             self.level += 1
 
-    def draw(self, surf: Surface, t: float, img: Surface) -> None:
-        rect = img.get_rect(center=self.pos)
-        surf.blit(img, rect)
+    def draw(self, surf: Surface, t: float, img: Surface) -> List[pygame.Rect]:
+        """Draw the ship and return the rects it touched."""
+        # Top-left from the centre, rounded like Rect(center=...) but without
+        # building a Rect first; the player never leaves the positive quadrant
+        w, h = img.get_size()
+        dirty = [surf.blit(img, (int(self.pos.x + 0.5) - w // 2, int(self.pos.y + 0.5) - h // 2))]
         color = NEON_CYAN if int(t * 30) % 2 == 0 or self.iframes <= 0 else NEON_YELLOW
-        pygame.draw.circle(surf, color, self.pos, self.radius, width=2)
+        dirty.append(pygame.draw.circle(surf, color, self.pos, self.radius, width=2))
         if self.shield_time >= POWERUP_DURATION:
             r = self.radius + 6 + 2 * math.sin(t * 8)
-            pygame.draw.circle(surf, BLUE, self.pos, int(r), width=2)
+            dirty.append(pygame.draw.circle(surf, BLUE, self.pos, int(r), width=2))
+        return dirty
 
 
 class EnemyType(Enum):
@@ -210,10 +551,19 @@ class EnemyType(Enum):
     MEGA_BOSS = auto()
 
 
+SPAWN_TYPES = (EnemyType.NORMAL, EnemyType.ZIGZAG, EnemyType.HOMING)  # regular spawns
+
+# Boss kinds have a fixed radius; their white ring (radius + 6) is baked into
+# the boss sprites at startup instead of being drawn every frame
+BOSS_RADII = {EnemyType.BOSS: 34, EnemyType.MEGA_BOSS: 56}
+
+
 @dataclass
 class Enemy:
-    pos: V2
-    vel: V2
+    px: float
+    py: float
+    vx: float
+    vy: float
     speed: float
     type: EnemyType = EnemyType.NORMAL
     radius: int = ENEMY_RADIUS
@@ -225,105 +575,228 @@ class Enemy:
     boss_kind: int = 0
     zigzag_phase: float = 0.0
 
-    def update(self, dt: float, player_pos: V2) -> None:
-        to_player = (player_pos - self.pos)
-        desired = to_player.normalize() * self.speed if to_player.length_squared() > 1e-4 else V2(0, 0)
-        jitter = V2(random.uniform(-1, 1), random.uniform(-1, 1)) * (self.speed * (0.15 if self.is_boss else 0.25))
-        steer = desired + jitter
-        self.vel += (steer - self.vel) * clamp((2.0 if self.is_boss else 4.0) * dt, 0.0, 1.0)
-        self.pos += self.vel * dt
-        if (self.pos.x < self.radius and self.vel.x < 0) or (self.pos.x > WIDTH - self.radius and self.vel.x > 0):
-            self.vel.x *= -1
-        if (self.pos.y < self.radius and self.vel.y < 0) or (self.pos.y > HEIGHT - self.radius and self.vel.y > 0):
-            self.vel.y *= -1
-        self.pos.x = clamp(self.pos.x, self.radius, WIDTH - self.radius)
-        self.pos.y = clamp(self.pos.y, self.radius, HEIGHT - self.radius)
-        if self.tier >= 1:
-            self.dash_cd -= dt
-            if self.dash_cd <= 0:
-                if to_player.length_squared() > 0:
-                    self.vel += to_player.normalize() * self.speed * (1.5 + 0.5 * self.tier)
-                self.dash_cd = random.uniform(1.5, 3.0)
-
-    def draw(self, surf: Surface, sprites: dict) -> None:
-        img = sprites.get(self.type)
-        if img is not None:
-            rect = img.get_rect(center=self.pos)
-            surf.blit(img, rect)
-        else:
-            pygame.draw.circle(surf, NEON_PINK, self.pos, self.radius)
-        if self.is_boss:
-            pygame.draw.circle(surf, WHITE, self.pos, self.radius + 6, width=2)
+
+class EnemyPool(SoAPool):
+    """Live enemies; ``append`` copies a spawned ``Enemy`` into the arrays."""
+
+    FIELDS = {
+        "px": np.float32,
+        "py": np.float32,
+        "vx": np.float32,
+        "vy": np.float32,
+        "speed": np.float32,
+        "radius": np.float32,
+        "hp": np.int32,
+        "is_boss": np.bool_,
+        "tier": np.int32,
+        "dash_cd": np.float32,
+        "shoot_cd": np.float32,
+        "boss_kind": np.int32,
+        "zigzag_phase": np.float32,
+        "kind": np.int8,  # EnemyType value
+    }
+
+    def __init__(self, capacity: int = 64):
+        super().__init__(capacity)
+
+    def append(self, e: Enemy) -> None:
+        i = self._claim()
+        self.px[i] = e.px
+        self.py[i] = e.py
+        self.vx[i] = e.vx
+        self.vy[i] = e.vy
+        self.speed[i] = e.speed
+        self.radius[i] = e.radius
+        self.hp[i] = e.hp
+        self.is_boss[i] = e.is_boss
+        self.tier[i] = e.tier
+        self.dash_cd[i] = e.dash_cd
+        self.shoot_cd[i] = e.shoot_cd
+        self.boss_kind[i] = e.boss_kind
+        self.zigzag_phase[i] = e.zigzag_phase
+        self.kind[i] = e.type.value
+
+    def draw(self, surf: Surface, atlas: Surface, rects: dict) -> List[pygame.Rect]:
+        """Blit every enemy from its ``rects[EnemyType]`` atlas cell in one call.
+
+        Boss cells already include the boss ring; only enemies without a cell
+        fall back to drawn circles. Returns the rects drawn.
+        """
+        n = self.n
+        # Atlas cell and half size per EnemyType value, for top-left blit positions
+        looks = {kind.value: (rect, rect.w / 2, rect.h / 2) for kind, rect in rects.items()}
+        seq = []
+        dirty = []
+        rows = zip(
+            self.px[:n].tolist(),
+            self.py[:n].tolist(),
+            self.radius[:n].tolist(),
+            self.kind[:n].tolist(),
+            self.is_boss[:n].tolist(),
+        )
+        for x, y, radius, kind, is_boss in rows:
+            look = looks.get(kind)
+            if look is not None:
+                rect, hw, hh = look
+                seq.append((atlas, (x - hw, y - hh), rect))
+            else:
+                dirty.append(pygame.draw.circle(surf, NEON_PINK, (x, y), radius))
+                if is_boss:
+                    dirty.append(pygame.draw.circle(surf, WHITE, (x, y), radius + 6, width=2))
+        dirty += surf.blits(seq)
+        return dirty
 
 
 @dataclass
 class Orb:
     pos: V2
     radius: int = ORB_RADIUS
-    def draw(self, surf: Surface) -> None:
-        pygame.draw.circle(surf, NEON_YELLOW, self.pos, self.radius)
+    def draw(self, surf: Surface) -> pygame.Rect:
+        rect = pygame.draw.circle(surf, NEON_YELLOW, self.pos, self.radius)
         pygame.draw.circle(surf, WHITE, self.pos, max(1, self.radius // 3))
+        return rect
 
 
 
-@dataclass
-class Bullet:
-    pos: V2
-    vel: V2
-    radius: int = BULLET_RADIUS
-    lifetime: float = BULLET_LIFETIME
-    pierce: int = 0
-    dmg: int = BULLET_BASE_DMG
-    from_enemy: bool = False
-    homing: bool = False
+class BulletPool(SoAPool):
+    FIELDS = {
+        "px": np.float32,
+        "py": np.float32,
+        "vx": np.float32,
+        "vy": np.float32,
+        "life": np.float32,
+        "pierce": np.int32,
+        "dmg": np.int32,
+        "from_enemy": np.bool_,
+        "homing": np.bool_,
+    }
 
-    def update(self, dt: float) -> None:
-        self.pos += self.vel * dt
-        self.lifetime -= dt
-    def alive(self) -> bool:
-        if self.lifetime <= 0:
-            return False
-        return -20 <= self.pos.x <= WIDTH + 20 and -20 <= self.pos.y <= HEIGHT + 20
-    def draw(
+    def __init__(self, capacity: int = 256):
+        super().__init__(capacity)
+
+    def spawn(
         self,
-        surf: Surface,
-        player_img: Optional[Surface] = None,
-        enemy_img: Optional[Surface] = None,
+        x: float,
+        y: float,
+        vx: float,
+        vy: float,
+        pierce: int = 0,
+        dmg: int = BULLET_BASE_DMG,
+        from_enemy: bool = False,
+        homing: bool = False,
     ) -> None:
-        if self.from_enemy:
-            if enemy_img is not None:
-                surf.blit(enemy_img, enemy_img.get_rect(center=self.pos))
-            else:
-                pygame.draw.circle(surf, RED, self.pos, self.radius)
-        else:
-            if player_img is not None:
-                surf.blit(player_img, player_img.get_rect(center=self.pos))
-            else:
-                pygame.draw.circle(surf, NEON_GREEN, self.pos, self.radius)
-
-
-@dataclass
-class Particle:
-    pos: V2
-    vel: V2
-    color: Tuple[int, int, int]
-    radius: float
-    life: float
-    full_life: float
+        i = self._claim()
+        self.px[i] = x
+        self.py[i] = y
+        self.vx[i] = vx
+        self.vy[i] = vy
+        self.life[i] = BULLET_LIFETIME
+        self.pierce[i] = pierce
+        self.dmg[i] = dmg
+        self.from_enemy[i] = from_enemy
+        self.homing[i] = homing
+
+    def spawn_many(
+        self,
+        x: float,
+        y: float,
+        vx: np.ndarray,
+        vy: np.ndarray,
+        pierce: int = 0,
+        dmg: int = BULLET_BASE_DMG,
+        from_enemy: bool = False,
+        homing: bool = False,
+    ) -> None:
+        """Append one bullet per entry of ``vx``/``vy``, all starting at ``(x, y)``."""
+        i = self._claim(vx.shape[0])
+        j = self.n
+        self.px[i:j] = x
+        self.py[i:j] = y
+        self.vx[i:j] = vx
+        self.vy[i:j] = vy
+        self.life[i:j] = BULLET_LIFETIME
+        self.pierce[i:j] = pierce
+        self.dmg[i:j] = dmg
+        self.from_enemy[i:j] = from_enemy
+        self.homing[i:j] = homing
 
     def update(self, dt: float) -> None:
-        self.pos += self.vel * dt
-        self.life -= dt
-
-    def alive(self) -> bool:
-        return self.life > 0
+        n = self.n
+        self.px[:n] += self.vx[:n] * dt
+        self.py[:n] += self.vy[:n] * dt
+        self.life[:n] -= dt
+
+    def alive_mask(self) -> np.ndarray:
+        """Boolean mask of bullets still alive and within 20px of the screen."""
+        n = self.n
+        # |p - centre| <= half + 20 tests both edges of an axis in one pass
+        hw, hh = CX, CY
+        mask = self.life[:n] > 0
+        mask &= np.abs(self.px[:n] - hw) <= hw + 20
+        mask &= np.abs(self.py[:n] - hh) <= hh + 20
+        return mask
+
+    def draw(self, surf: Surface, atlas: Surface, player_rect: pygame.Rect, enemy_rect: pygame.Rect) -> List[pygame.Rect]:
+        """Blit every on-screen bullet from its atlas cell in one call; returns the rects drawn."""
+        looks = [(rect, rect.w / 2, rect.h / 2) for rect in (player_rect, enemy_rect)]
+        n = self.n
+        # Bullets live until 20px past the edge; skip the ones already outside
+        w, h = surf.get_size()
+        r = BULLET_RADIUS
+        px, py = self.px[:n], self.py[:n]
+        on = (px > -r) & (px < w + r) & (py > -r) & (py < h + r)
+        seq = []
+        for x, y, from_enemy in zip(px[on].tolist(), py[on].tolist(), self.from_enemy[:n][on].tolist()):
+            rect, hw, hh = looks[from_enemy]
+            seq.append((atlas, (x - hw, y - hh), rect))
+        return surf.blits(seq)
+
+
+class ParticlePool(SoAPool):
+    FIELDS = {
+        "px": np.float32,
+        "py": np.float32,
+        "vx": np.float32,
+        "vy": np.float32,
+        "life": np.float32,
+        "full_life": np.float32,
+        "radius": np.float32,
+        "color": np.uint8,  # index into EXPLOSION_COLORS
+    }
+
+    def __init__(self, capacity: int = 256):
+        super().__init__(capacity)
+
+    def spawn_many(self, x: float, y: float, vx: np.ndarray, vy: np.ndarray, life: np.ndarray, radius: np.ndarray, color: np.ndarray) -> None:
+        """Append one particle per entry of the arrays, all starting at ``(x, y)``."""
+        i = self._claim(vx.shape[0])
+        j = self.n
+        self.px[i:j] = x
+        self.py[i:j] = y
+        self.vx[i:j] = vx
+        self.vy[i:j] = vy
+        self.life[i:j] = life
+        self.full_life[i:j] = life
+        self.radius[i:j] = radius
+        self.color[i:j] = color
 
-    def draw(self, surf: Surface) -> None:
-        if self.life <= 0:
-            return
-        r = int(self.radius * (self.life / self.full_life))
-        if r > 0:
-            pygame.draw.circle(surf, self.color, self.pos, r)
+    def update(self, dt: float) -> None:
+        n = self.n
+        self.px[:n] += self.vx[:n] * dt
+        self.py[:n] += self.vy[:n] * dt
+        self.life[:n] -= dt
+        self.compact(self.life[:n] > 0)
+
+    def draw(self, surf: Surface, atlas: Surface, rects: list) -> List[pygame.Rect]:
+        """Blit every visible particle from its ``rects[color][radius]`` atlas cell in one call; returns the rects drawn."""
+        n = self.n
+        r = (self.radius[:n] * (self.life[:n] / self.full_life[:n])).astype(np.int32)
+        # Cull particles that have drifted off the surface or shrunk to nothing
+        w, h = surf.get_size()
+        px, py = self.px[:n], self.py[:n]
+        on = (r > 0) & (px > -r) & (px < w + r) & (py > -r) & (py < h + r)
+        rows = zip(px[on].tolist(), py[on].tolist(), r[on].tolist(), self.color[:n][on].tolist())
+        return surf.blits([(atlas, (x - rr, y - rr), rects[c][rr]) for x, y, rr, c in rows])
 
 
 class PUType(Enum):
@@ -334,43 +807,99 @@ class PUType(Enum):
     PIERCE = auto()
 
 
+PU_COLORS = {
+    PUType.RAPID: NEON_YELLOW,
+    PUType.SPREAD: NEON_PINK,
+    PUType.SHIELD: BLUE,
+    PUType.SPEED: NEON_CYAN,
+    PUType.PIERCE: NEON_GREEN,
+}
+PU_GLYPHS = {PUType.RAPID:"R", PUType.SPREAD:"S", PUType.SHIELD:"H", PUType.SPEED:"V", PUType.PIERCE:"P"}
+
+# Pre-composed power-up sprite (disc + glyph) per PUType; Game.__init__ fills
+# it once pygame.font is initialised
+_PU_FONT: Optional[pygame.font.Font] = None
+_PU_SPRITES: dict = {}
+
+
+def powerup_sprite(kind: PUType) -> Surface:
+    global _PU_FONT
+    img = _PU_SPRITES.get(kind)
+    if img is None:
+        if _PU_FONT is None:
+            _PU_FONT = pygame.font.SysFont("consolas", 16)
+        img = _PU_SPRITES[kind] = circle_sprite(PU_COLORS[kind], POWERUP_RADIUS)
+        glyph = _PU_FONT.render(PU_GLYPHS[kind], True, BLACK)
+        img.blit(glyph, glyph.get_rect(center=(POWERUP_RADIUS, POWERUP_RADIUS)))
+    return img
+
+
 @dataclass
 class PowerUp:
     pos: V2
     kind: PUType
     radius: int = POWERUP_RADIUS
-    def draw(self, surf: Surface) -> None:
-        color = {
-            PUType.RAPID: NEON_YELLOW,
-            PUType.SPREAD: NEON_PINK,
-            PUType.SHIELD: BLUE,
-            PUType.SPEED: NEON_CYAN,
-            PUType.PIERCE: NEON_GREEN,
-        }[self.kind]
-        pygame.draw.circle(surf, color, self.pos, self.radius)
-        glyph = {PUType.RAPID:"R", PUType.SPREAD:"S", PUType.SHIELD:"H", PUType.SPEED:"V", PUType.PIERCE:"P"}[self.kind]
-        font = pygame.font.SysFont("consolas", 16)
-        img = font.render(glyph, True, BLACK)
-        surf.blit(img, img.get_rect(center=self.pos))
+
+    def blit_item(self) -> Tuple[Surface, Tuple[float, float]]:
+        """``(sprite, topleft)`` pair for batching into ``Surface.blits``."""
+        return powerup_sprite(self.kind), (self.pos.x - self.radius, self.pos.y - self.radius)
 
 
 # ------------------------------ Starfield ----------------------------------- #
 class Starfield:
     def __init__(self, n: int = 120):
-        self.stars: List[Tuple[float, float, float]] = []
-        for _ in range(n):
-            self.stars.append([random.uniform(0, WIDTH), random.uniform(0, HEIGHT), random.uniform(10, 80)])
+        # One row per star: x, y, speed
+        self.stars = np.column_stack(
+            (
+                np.random.uniform(0, WIDTH, n),
+                np.random.uniform(0, HEIGHT, n),
+                np.random.uniform(10, 80, n),
+            )
+        ).astype(np.float32)
+        self.shade = np.clip(120 + self.stars[:, 2] * 1.3, 120, 255).astype(np.uint32)
+        # Grey shades packed for a surface's channel shifts, built on first draw
+        self._packed = None
+        self._packed_shifts = None
+        # Pixel offsets of a star's 2x2 block, broadcast against the positions
+        self._block_dx = np.array([0, 1, 0, 1], np.intp)
+        self._block_dy = np.array([0, 0, 1, 1], np.intp)
+        # x, y, w, h of every star block, returned by draw as dirty rects
+        self._rects = np.full((n, 4), 2, np.intp)
+
     def update(self, dt: float, camera_vel: V2) -> None:
-        for s in self.stars:
-            s[1] += (s[2] + camera_vel.y * 0.2) * dt
-            s[0] += (camera_vel.x * 0.2) * dt
-            if s[1] > HEIGHT:
-                s[0] = random.uniform(0, WIDTH)
-                s[1] = -2
-    def draw(self, surf: Surface) -> None:
-        for x, y, speed in self.stars:
-            b = clamp(int(120 + speed * 1.3), 120, 255)
-            surf.fill((b, b, b), rect=pygame.Rect(int(x), int(y), 2, 2))
+        stars = self.stars
+        stars[:, 1] += (stars[:, 2] + camera_vel.y * 0.2) * dt
+        stars[:, 0] += (camera_vel.x * 0.2) * dt
+        wrapped = stars[:, 1] > HEIGHT
+        count = int(np.count_nonzero(wrapped))
+        if count:
+            stars[wrapped, 0] = np.random.uniform(0, WIDTH, count)
+            stars[wrapped, 1] = -2
+
+    def draw(self, surf: Surface) -> list:
+        # Each star is a 2x2 block; write every block pixel straight into the
+        # pixel buffer in one indexed assignment instead of one fill() per star.
+        # Stars move at their own speeds, so a single scrolled layer would lose
+        # the parallax.
+        shifts = surf.get_shifts()
+        if shifts != self._packed_shifts:
+            rs, gs, bs, _ = shifts
+            shade = self.shade
+            self._packed = (shade << rs) | (shade << gs) | (shade << bs)
+            self._packed_shifts = shifts
+        w, h = surf.get_size()
+        px = self.stars[:, 0].astype(np.intp)[:, None] + self._block_dx
+        py = self.stars[:, 1].astype(np.intp)[:, None] + self._block_dy
+        on = (px >= 0) & (px < w) & (py >= 0) & (py < h)
+        packed = np.broadcast_to(self._packed[:, None], on.shape)
+        # One mapped 32-bit word per pixel rather than three channel bytes
+        pixels = pygame.surfarray.pixels2d(surf)
+        pixels[px[on], py[on]] = packed[on]
+        del pixels
+        rects = self._rects
+        rects[:, 0] = px[:, 0]
+        rects[:, 1] = py[:, 0]
+        return rects.tolist()
 
 
 # ------------------------------ Game State ---------------------------------- #
@@ -381,24 +910,97 @@ class GameState:
     SETTINGS = 3
 
 
+def _timer_property(index: int) -> property:
+    """Expose ``Game._timers[index]`` as a plain float attribute."""
+
+    def get(self) -> float:
+        return float(self._timers[index])
+
+    def set(self, value: float) -> None:
+        self._timers[index] = value
+
+    return property(get, set)
+
+
 class Game:
+    # Power-up effect timers (seconds left), stored in self._timers so
+    # update_play can tick them all with one vector op
+    rapid_time = _timer_property(T_RAPID)
+    spread_time = _timer_property(T_SPREAD)
+    pierce_time = _timer_property(T_PIERCE)
+    speed_time = _timer_property(T_SPEED)
+
     def __init__(self):
         pygame.init()
         # Initialize mixer for sound effects and music
         pygame.mixer.init()
         pygame.display.set_caption(TITLE)
         self.screen = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
-        global WIDTH, HEIGHT
+        global WIDTH, HEIGHT, CX, CY
         WIDTH, HEIGHT = self.screen.get_size()
+        CX, CY = WIDTH / 2, HEIGHT / 2
         self.clock = pygame.time.Clock()
         self.font_big = pygame.font.SysFont("consolas", 48)
         self.font = pygame.font.SysFont("consolas", 24)
         self.font_small = pygame.font.SysFont("consolas", 18)
+        self._text_cache: OrderedDict[Tuple[int, str, Tuple[int, int, int]], pygame.Surface] = OrderedDict()
+        # HUD stat/badge text and the values it was laid out for (see draw_hud)
+        self._hud_key: Optional[tuple] = None
+        self._hud_items: List[Tuple[Surface, Tuple[int, int]]] = []
+        # Constant screen text, rendered and centred once: (surface, rect) pairs
+        cx, cy = CX, CY
+        centered = self._centered_text
+        self._static_surfs = {
+            "title": [
+                centered(self.font_big, TITLE, NEON_PINK, (cx, cy - 40)),
+                centered(self.font, "SPACE to start — WASD/Arrows to move", GREY, (cx, cy + 10)),
+                centered(self.font_small, "Auto-shoot, collect coins, B for shop, P to pause.", GREY, (cx, cy + 40)),
+                centered(self.font_small, "S for Settings", GREY, (cx, cy + 70)),
+            ],
+            "game_over": [
+                centered(self.font_big, "GAME OVER", NEON_PINK, (cx, cy - 40)),
+                centered(self.font_small, "Press R to restart, ESC to quit", GREY, (cx, cy + 70)),
+            ],
+        }
+        # All game-over text lines and the (score, high score) they show
+        self._go_key: Optional[Tuple[int, int]] = None
+        self._go_items: List[Tuple[Surface, pygame.Rect]] = []
         self.running = True
         self.state = GameState.TITLE
         self.t = 0.0
 
         self.starfield = Starfield()
+        # Translucent overlays for the shop and game-over screens
+        self._shop_panel = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA).convert_alpha()
+        self._shop_panel.fill((0, 0, 0, 200))
+        self._gameover_panel = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA).convert_alpha()
+        self._gameover_panel.fill((0, 0, 0, 160))
+        # Frozen scene under the game-over panel; taken on its first frame
+        self._gameover_bg: Optional[Surface] = None
+        # Rects drawn by draw_play/draw_title this frame and last; see run()
+        self._dirty: List[pygame.Rect] = []
+        self._last_dirty: List[pygame.Rect] = []
+        self._full_frame = True
+        self._last_full = True
+        self._last_state = self.state
+        # (update(dt, events), draw) per GameState, dispatched by run()
+        self._state_table = {
+            GameState.TITLE: (lambda dt, events: self.update_title(dt), self.draw_title),
+            GameState.PLAYING: (self._update_playing, self.draw_play),
+            GameState.SETTINGS: (self.update_settings, self.draw_settings),
+            GameState.GAME_OVER: (lambda dt, events: self.update_game_over(dt), self.draw_game_over),
+        }
+
+        # Enemy broadphase grid, rebuilt every frame (see _rebuild_enemy_grid)
+        self._grid_w = WIDTH // ENEMY_GRID_CELL + 1
+        self._grid_h = HEIGHT // ENEMY_GRID_CELL + 1
+        self._grid_start = np.zeros(self._grid_w * self._grid_h + 1, np.int32)
+        self._grid_fill = np.zeros_like(self._grid_start)
+        self._grid_items = np.empty(4 * ENEMY_MAX, np.int32)
+
+        # Uniform [-1, 1) noise consumed in slices by jitter and explosions
+        self._noise = np.random.uniform(-1, 1, (NOISE_ROWS, 3)).astype(np.float32)
+        self._noise_i = 0
 
         # Sprites
         self.player_img = load_sprite("player.png", PLAYER_RADIUS * 2, NEON_CYAN)
@@ -410,16 +1012,40 @@ class Game:
             EnemyType.MEGA_BOSS: load_sprite("bigboss.png", 96, RED),
         }
         self.bullet_img = load_sprite("bullet.png", BULLET_RADIUS * 2, NEON_GREEN)
+        self.enemy_bullet_img = circle_sprite(RED, BULLET_RADIUS)
+        # Pooled entities draw from one atlas so each batch reads one source
+        # surface. Particle cells are indexed [color][radius]; drawn radii are
+        # whole pixels.
+        atlas_src = {kind: img for kind, img in self.enemy_sprites.items() if img is not None}
+        for kind, radius in BOSS_RADII.items():
+            if kind in atlas_src:
+                atlas_src[kind] = ringed_sprite(atlas_src[kind], radius + 6, WHITE)
+        atlas_src["bullet"] = self.bullet_img
+        atlas_src["enemy_bullet"] = self.enemy_bullet_img
+        for c, color in enumerate(EXPLOSION_COLORS):
+            for r in range(1, 9):
+                atlas_src[c, r] = circle_sprite(color, r)
+        self._atlas, rects = pack_atlas(atlas_src)
+        self._enemy_rects = {kind: rects[kind] for kind in self.enemy_sprites if kind in rects}
+        self._bullet_rect = rects["bullet"]
+        self._enemy_bullet_rect = rects["enemy_bullet"]
+        self._particle_rects = [[None] + [rects[c, r] for r in range(1, 9)] for c in range(len(EXPLOSION_COLORS))]
+        # Build the power-up sprites (and their font) now, not on first pickup
+        for kind in PUType:
+            powerup_sprite(kind)
+        for img in (self.player_img, self._atlas):
+            assert img.get_bitsize() == self.screen.get_bitsize(), "sprite not in display format"
         self.snd_shoot = load_sound("shoot.wav")
 
         self.high_score = 0
+        self._hs_dirty = False  # high_score beaten but not yet written
         self._load_save()
         pygame.mixer.music.set_volume(self.music_volume)
 
 
         # Gameplay
-        self.player = Player(V2(WIDTH / 2, HEIGHT / 2))
-        self.enemies: List[Enemy] = []
+        self.player = Player(V2(CX, CY))
+        self.enemies = EnemyPool()
         self.orb = self._spawn_orb()
         self.score = 0
         self.lives = LIVES_START
@@ -431,21 +1057,23 @@ class Game:
         self.shake = 0.0
 
         # Combat
-        self.bullets: List[Bullet] = []
-        self.particles: List[Particle] = []
+        self.bullets = BulletPool()
+        self.particles = ParticlePool()
 
         # Power-ups
         self.powerups: List[PowerUp] = []
         self.pu_spawn_timer = random.uniform(POWERUP_SPAWN_MIN, POWERUP_SPAWN_MAX)
-        self.rapid_time = 0.0
-        self.speed_time = 0.0
-        self.spread_time = 0.0
-        self.pierce_time = 0.0
+        self._timers = np.zeros(4)
+        self._acc_low = 0.0  # time banked towards the next _tick_low
+        self._acc_physics = 0.0  # frame time not yet simulated in PHYSICS_DT steps
 
         # Currency & progression
         self.coins = 0
         self.kills = 0
         self.shop_open = False
+        # Cached (surface, dest) pairs for draw_shop, rebuilt when dirty
+        self._shop_items: List[Tuple[Surface, Tuple[float, float]]] = []
+        self._shop_dirty = True
         self.upgrades = [
             {"name": "Damage +1", "cost": 25, "key": pygame.K_1, "fn": self._buy_damage},
             {"name": "Fire Rate -10%", "cost": 30, "key": pygame.K_2, "fn": self._buy_firerate},
@@ -457,6 +1085,11 @@ class Game:
 
         # Boss logic
         self.boss_timer = 20.0  # seconds to next boss
+        self.boss_count = 0  # bosses in the pool; kept in step with spawns/kills
+
+        # Shot closure for the current upgrades/power-ups; None means rebuild
+        self._fire_fn = None
+        self._fire_cooldown = 0.0
 
     # ---------------------- Persistence ---------------------- #
 
@@ -494,29 +1127,36 @@ class Game:
         except Exception:
             pass
 
+    def _save_high_score(self) -> None:
+        """Write the save file if a new high score hasn't been written yet."""
+        if self._hs_dirty:
+            self._hs_dirty = False
+            self._save()
+
 
     # ---------------------- Spawning ------------------------- #
     def _spawn_enemy(self) -> Enemy:
-        side = random.choice(["left", "right", "top", "bottom"])
-        if side == "left":
-            pos = V2(-ENEMY_RADIUS, random.uniform(ENEMY_RADIUS, HEIGHT - ENEMY_RADIUS))
-            vel = V2(1, 0)
-        elif side == "right":
-            pos = V2(WIDTH + ENEMY_RADIUS, random.uniform(ENEMY_RADIUS, HEIGHT - ENEMY_RADIUS))
-            vel = V2(-1, 0)
-        elif side == "top":
-            pos = V2(random.uniform(ENEMY_RADIUS, WIDTH - ENEMY_RADIUS), -ENEMY_RADIUS)
-            vel = V2(0, 1)
+        # Side 0-3: left, right, top, bottom
+        side = random.randrange(4)
+        if side == 0:
+            px, py = -ENEMY_RADIUS, random.uniform(ENEMY_RADIUS, HEIGHT - ENEMY_RADIUS)
+            dx, dy = 1, 0
+        elif side == 1:
+            px, py = WIDTH + ENEMY_RADIUS, random.uniform(ENEMY_RADIUS, HEIGHT - ENEMY_RADIUS)
+            dx, dy = -1, 0
+        elif side == 2:
+            px, py = random.uniform(ENEMY_RADIUS, WIDTH - ENEMY_RADIUS), -ENEMY_RADIUS
+            dx, dy = 0, 1
         else:
-            pos = V2(random.uniform(ENEMY_RADIUS, WIDTH - ENEMY_RADIUS), HEIGHT + ENEMY_RADIUS)
-            vel = V2(0, -1)
+            px, py = random.uniform(ENEMY_RADIUS, WIDTH - ENEMY_RADIUS), HEIGHT + ENEMY_RADIUS
+            dx, dy = 0, -1
         speed = self.enemy_speed * random.uniform(0.9, 1.2)
         tier = random.randint(0, self.enemy_level)
         speed *= 1.0 + 0.15 * tier
         hp = 1 + tier
         dash = random.uniform(1.5, 3.0) if tier >= 1 else 0.0
 
-        etype = random.choice([EnemyType.NORMAL, EnemyType.ZIGZAG, EnemyType.HOMING])
+        etype = random.choice(SPAWN_TYPES)
         shoot = 0.0
         zig = 0.0
         if etype == EnemyType.ZIGZAG:
@@ -529,8 +1169,10 @@ class Game:
             shoot = random.uniform(2.0, 3.5)
 
         return Enemy(
-            pos=pos,
-            vel=vel * speed,
+            px=px,
+            py=py,
+            vx=dx * speed,
+            vy=dy * speed,
             speed=speed,
             hp=hp,
             tier=tier,
@@ -541,7 +1183,7 @@ class Game:
         )
 
     def _spawn_boss(self) -> Enemy:
-        pos = V2(random.uniform(120, WIDTH - 120), -40)
+        px = random.uniform(120, WIDTH - 120)
         boss_kind = random.choice([0, 1, 2])
         if boss_kind == 2:
             speed = max(80.0, self.enemy_speed * 0.8)
@@ -549,7 +1191,6 @@ class Game:
             tier = 3
             dash = 0.0
             shoot = random.uniform(1.5, 2.5)
-            radius = 56
             etype = EnemyType.MEGA_BOSS
         else:
             speed = max(90.0, self.enemy_speed * 0.9)
@@ -557,14 +1198,15 @@ class Game:
             tier = 2 if boss_kind == 1 else 1
             dash = random.uniform(1.5, 3.0)
             shoot = random.uniform(1.0, 2.0) if boss_kind == 1 else 0.0
-            radius = 34
             etype = EnemyType.BOSS
 
         return Enemy(
-            pos=pos,
-            vel=V2(0, speed),
+            px=px,
+            py=-40,
+            vx=0.0,
+            vy=speed,
             speed=speed,
-            radius=radius,
+            radius=BOSS_RADII[etype],
             hp=hp,
             is_boss=True,
             tier=tier,
@@ -582,30 +1224,41 @@ class Game:
         pos = V2(random.uniform(60, WIDTH - 60), random.uniform(60, HEIGHT - 60))
         self.powerups.append(PowerUp(pos, kind))
 
-    def _spawn_explosion(self, pos: V2) -> None:
-        colors = [
-            (255, 0, 0),
-            (255, 127, 0),
-            (255, 255, 0),
-            (0, 255, 0),
-            (0, 0, 255),
-            (75, 0, 130),
-            (148, 0, 211),
-        ]
-        for _ in range(20):
-            direction = V2(random.uniform(-1, 1), random.uniform(-1, 1))
-            if direction.length_squared() == 0:
-                direction = V2(1, 0)
-            vel = direction.normalize() * random.uniform(80, 200)
-            life = random.uniform(0.4, 0.8)
-            radius = random.uniform(4, 8)
-            color = random.choice(colors)
-            self.particles.append(Particle(pos.copy(), vel, color, radius, life, life))
+    def _noise_rows(self, count: int) -> np.ndarray:
+        """Next ``count`` rows of the noise table, refilled once it runs out."""
+        if count > NOISE_ROWS:
+            return np.random.uniform(-1, 1, (count, 3)).astype(np.float32)
+        i = self._noise_i
+        if i + count > NOISE_ROWS:
+            self._noise[:] = np.random.uniform(-1, 1, (NOISE_ROWS, 3))
+            i = 0
+        self._noise_i = i + count
+        return self._noise[i : i + count]
+
+    def _spawn_explosion(self, x: float, y: float, count: int = 20) -> None:
+        noise = self._noise_rows(count)
+        dx, dy = noise[:, 0].copy(), noise[:, 1]
+        length = np.hypot(dx, dy)
+        still = length == 0
+        dx[still], length[still] = 1.0, 1.0
+        speed = (140.0 + 60.0 * noise[:, 2]) / length
+        self.particles.spawn_many(
+            x,
+            y,
+            dx * speed,
+            dy * speed,
+            np.random.uniform(0.4, 0.8, count),
+            np.random.uniform(4, 8, count),
+            np.random.randint(0, len(EXPLOSION_COLORS), count),
+        )
 
     # ---------------------- Reset / Start -------------------- #
     def reset(self) -> None:
-        self.player = Player(V2(WIDTH / 2, HEIGHT / 2))
+        self.player = Player(V2(CX, CY))
+        self._gameover_bg = None
         self.enemies.clear()
+        self.boss_count = 0
+        self._fire_fn = None
         self.orb = self._spawn_orb()
         self.score = 0
         self.lives = LIVES_START
@@ -618,13 +1271,23 @@ class Game:
         self.bullets.clear()
         self.powerups.clear()
         self.pu_spawn_timer = random.uniform(POWERUP_SPAWN_MIN, POWERUP_SPAWN_MAX)
-        self.rapid_time = self.speed_time = self.spread_time = self.pierce_time = 0.0
+        self._timers[:] = 0.0
+        self._acc_low = 0.0
         self.coins = 0
         self.kills = 0
         self.shop_open = False
+        self._shop_dirty = True
         self.boss_timer = 20.0
 
     # ---------------------- Update Loop ---------------------- #
+    def _update_playing(self, dt: float, events: List[pygame.event.Event]) -> None:
+        # Gameplay advances in fixed steps, two per frame at 60 FPS
+        acc = min(self._acc_physics + dt, MAX_PHYSICS_STEPS * PHYSICS_DT)
+        while acc >= PHYSICS_DT and self.state == GameState.PLAYING:
+            self.update_play(PHYSICS_DT)
+            acc -= PHYSICS_DT
+        self._acc_physics = acc
+
     def update_title(self, dt: float) -> None:
         self.starfield.update(dt, V2(0, 35))
 
@@ -655,11 +1318,14 @@ class Game:
                     self._save()
 
     def _nearest_enemy_dir(self) -> Optional[V2]:
-        if not self.enemies:
+        """Unit vector from the player to the closest enemy."""
+        n = self.enemies.n
+        if not n:
             return None
-        p = self.player.pos
-        nearest = min(self.enemies, key=lambda e: e.pos.distance_squared_to(p))
-        to = nearest.pos - p
+        dx = self.enemies.px[:n] - self.player.pos.x
+        dy = self.enemies.py[:n] - self.player.pos.y
+        j = int((dx * dx + dy * dy).argmin())
+        to = V2(float(dx[j]), float(dy[j]))
         return to.normalize() if to.length_squared() else V2(1, 0)
 
     def _try_fire(self) -> None:
@@ -668,39 +1334,81 @@ class Game:
         aim = self._nearest_enemy_dir()
         if aim is None:
             return
+        if self._fire_fn is None:
+            self._fire_fn = self._make_fire_fn()
+        self.player.fire_timer = self._fire_cooldown
+        self._fire_fn(aim, self.player.pos, self.bullets)
+        self.shake = min(6.0, self.shake + 1.5)
+
+    def _make_fire_fn(self) -> Callable[[V2, V2, BulletPool], None]:
+        """Build the shot closure with the current upgrades and power-ups baked in.
+
+        Anything that changes the pattern (a purchase, a pickup, a power-up
+        running out, a reset) sets ``self._fire_fn`` to None so the next shot
+        rebuilds it.
+        """
         cooldown = self.player.fire_cooldown * (0.45 if self.rapid_time > 0 else 1.0)
-        self.player.fire_timer = max(0.08, cooldown)
-        dirs = [aim]
+        self._fire_cooldown = max(0.08, cooldown)
         if self.spread_time > 0 or self.player.spread_level > 0:
-            level = max(self.player.spread_level, 1)
-            angles = [10, -10] if level == 1 else [8, -8, 16, -16]
-            for ang in angles:
-                rad = math.radians(ang)
-                rot = V2(aim.x * math.cos(rad) - aim.y * math.sin(rad), aim.x * math.sin(rad) + aim.y * math.cos(rad))
-                dirs.append(rot.normalize())
-        for d in dirs:
-            vel = d * BULLET_SPEED
-            self.bullets.append(Bullet(self.player.pos + d * (self.player.radius + 6), vel, pierce=(1 if self.pierce_time > 0 else self.player.pierce), dmg=self.player.damage))
-            if self.snd_shoot:
-                self.snd_shoot.play()
-        self.shake = min(6.0, self.shake + 1.5)
+            rots = SPREAD_DIRS[max(self.player.spread_level, 1)]
+        else:
+            rots = SPREAD_DIRS[0]
+        pierce = 1 if self.pierce_time > 0 else self.player.pierce
+        dmg = self.player.damage
+        offset = self.player.radius + 6
+        spawn = BulletPool.spawn
+        snd = self.snd_shoot
+
+        def fire(aim: V2, pos: V2, bullets: BulletPool) -> None:
+            ax, ay, px, py = aim.x, aim.y, pos.x, pos.y
+            for c, s in rots:
+                # Rotating a unit vector keeps it unit length; no normalize needed
+                dx = ax * c - ay * s
+                dy = ax * s + ay * c
+                spawn(bullets, px + dx * offset, py + dy * offset, dx * BULLET_SPEED, dy * BULLET_SPEED, pierce, dmg)
+                if snd:
+                    snd.play()
+
+        return fire
+
+    def _rebuild_enemy_grid(self, ex: np.ndarray, ey: np.ndarray, er: np.ndarray, pad: float) -> Tuple[float, int, int]:
+        """Bucket the enemies and return the ``(cell, gw, gh)`` to query with.
+
+        Below ``ENEMY_GRID_MIN`` enemies a single cell holds them all, which
+        turns the query into a plain scan without the per-cell bookkeeping.
+        """
+        if ex.shape[0] < ENEMY_GRID_MIN:
+            gw = gh = 1
+            need = ex.shape[0]
+        else:
+            gw, gh = self._grid_w, self._grid_h
+            # Padding by the query radius lets bullets/the player test one cell
+            span = int(2 * (float(er.max()) + pad) // ENEMY_GRID_CELL) + 2
+            need = ex.shape[0] * span * span
+        if self._grid_items.shape[0] < need:
+            self._grid_items = np.empty(need, np.int32)
+        cell = float(ENEMY_GRID_CELL)
+        build_enemy_grid(ex, ey, er, float(pad), cell, gw, gh, self._grid_start, self._grid_fill, self._grid_items)
+        return cell, gw, gh
 
     def _has_boss(self) -> bool:
-        return any(e.is_boss for e in self.enemies)
+        return self.boss_count > 0
 
     def update_play(self, dt: float) -> None:
-        keys = pygame.key.get_pressed()
-        # Toggle shop (handled in event too, but keep here if holding)
-        if keys[pygame.K_b]:
-            pass
+        # Hot attributes bound once per frame
+        player = self.player
+        enemies = self.enemies
+        bullets = self.bullets
+        uniform = random.uniform
+        move = movement_mask(pygame.key.get_pressed())
         # Pause gameplay when shop is open
         if self.shop_open:
-            self.player.update(dt, keys)  # allow moving cursor feel; but no enemies
-            self.starfield.update(dt, self.player.vel)
+            player.update(dt, move)  # allow moving cursor feel; but no enemies
+            self.starfield.update(dt, player.vel)
             return
 
-        self.player.update(dt, keys)
-        self.starfield.update(dt, self.player.vel)
+        player.update(dt, move)
+        self.starfield.update(dt, player.vel)
 
         self.enemy_level = min(2, int(self.t // 30))
 
@@ -708,125 +1416,192 @@ class Game:
         self._try_fire()
 
         # Bullets
-        for b in self.bullets:
-            if b.from_enemy and b.homing:
-                to = self.player.pos - b.pos
-                if to.length_squared() > 0:
-                    desired = to.normalize() * ENEMY_BULLET_SPEED
-                    b.vel += (desired - b.vel) * clamp(4.0 * dt, 0.0, 1.0)
-            b.update(dt)
-        new_bullets: List[Bullet] = []
-        for b in self.bullets:
-            if not b.alive():
-                continue
-            if b.from_enemy:
-                if self.player.iframes <= 0 and circle_collision(b.pos, b.radius, self.player.pos, self.player.radius):
-                    if self.player.shield_time >= POWERUP_DURATION:
-                        self.player.shield_time = 0.0
-                        self.player.iframes = 0.2
-                        self.shake = 8.0
-                    else:
-                        self.lives -= 1
-                        self.player.iframes = PLAYER_IFRAMES
-                        self.shake = 12.0
-                        if self.lives <= 0:
-                            self.state = GameState.GAME_OVER
+        n = bullets.n
+        homing = np.flatnonzero(bullets.from_enemy[:n] & bullets.homing[:n])
+        if homing.size:
+            tx = player.pos.x - bullets.px[homing]
+            ty = player.pos.y - bullets.py[homing]
+            dist = np.hypot(tx, ty)
+            steer = dist > 0
+            homing, tx, ty, dist = homing[steer], tx[steer], ty[steer], dist[steer]
+            k = clamp(4.0 * dt, 0.0, 1.0)
+            bullets.vx[homing] += (tx / dist * ENEMY_BULLET_SPEED - bullets.vx[homing]) * k
+            bullets.vy[homing] += (ty / dist * ENEMY_BULLET_SPEED - bullets.vy[homing]) * k
+        bullets.update(dt)
+        keep = bullets.alive_mask()
+        from_enemy = bullets.from_enemy[:n]
+        bx, by = bullets.px[:n], bullets.py[:n]
+
+        # Enemy bullets vs player: the first hit grants iframes, so at most one lands
+        if player.iframes <= 0:
+            dx = bx - player.pos.x
+            dy = by - player.pos.y
+            reach = BULLET_RADIUS + player.radius
+            hits = keep & from_enemy & (dx * dx + dy * dy <= reach * reach)
+            if hits.any():
+                keep[int(hits.argmax())] = False
+                if player.shield_time >= POWERUP_DURATION:
+                    player.shield_time = 0.0
+                    player.iframes = 0.2
+                    self.shake = 8.0
                 else:
-                    new_bullets.append(b)
-                continue
-            hit_any = False
-            for e in list(self.enemies):
-                if circle_collision(b.pos, b.radius, e.pos, e.radius):
-                    e.hp -= b.dmg
-                    hit_any = True
-                    if e.hp <= 0:
-                        self.enemies.remove(e)
-                        self.kills += 1
-                        self._spawn_explosion(e.pos)
-                        if e.is_boss:
-                            self.score += BOSS_KILL_SCORE
-                            self.coins += random.randint(COINS_BOSS_MIN, COINS_BOSS_MAX)
-                            self.player.gain_xp(XP_BOSS_KILL)
-                            self.boss_timer = max(12.0, 28.0 - (self.t * 0.05))
-                        else:
-                            self.score += KILL_SCORE
-                            self.coins += random.randint(COINS_NORMAL_MIN, COINS_NORMAL_MAX)
-                            self.player.gain_xp(XP_KILL)
-                        self.shake = min(10.0, self.shake + (4.0 if e.is_boss else 2.5))
-                    if b.pierce > 0:
-                        b.pierce -= 1
-                        hit_any = False
-                    else:
-                        break
-            if not hit_any:
-                new_bullets.append(b)
-        self.bullets = new_bullets
+                    self.lives -= 1
+                    player.iframes = PLAYER_IFRAMES
+                    self.shake = 12.0
+                    if self.lives <= 0:
+                        self.state = GameState.GAME_OVER
+
+        # Player bullets vs enemies
+        ne = enemies.n
+        if ne and (keep & ~from_enemy).any():
+            ex, ey, er, ehp = enemies.px[:ne], enemies.py[:ne], enemies.radius[:ne], enemies.hp[:ne]
+            cell, gw, gh = self._rebuild_enemy_grid(ex, ey, er, BULLET_RADIUS)
+            nh = resolve_bullet_hits(
+                bx, by, float(BULLET_RADIUS), bullets.dmg[:n], bullets.pierce[:n], keep, from_enemy,
+                ex, ey, er, ehp, cell, gw, gh, self._grid_start, self._grid_items,
+            )
+        else:
+            nh = 0
+        if nh:
+            # Every pooled enemy was alive before the kernel ran, so the kills
+            # are exactly the non-positive HP slots. Run their side effects,
+            # then drop them all in one order-preserving pass.
+            dead = ehp <= 0
+            for j in np.flatnonzero(dead).tolist():
+                is_boss = bool(enemies.is_boss[j])
+                self.kills += 1
+                self._spawn_explosion(float(ex[j]), float(ey[j]))
+                if is_boss:
+                    self.boss_count -= 1
+                    self.score += BOSS_KILL_SCORE
+                    self.coins += random.randint(COINS_BOSS_MIN, COINS_BOSS_MAX)
+                    player.gain_xp(XP_BOSS_KILL)
+                    self.boss_timer = max(12.0, 28.0 - (self.t * 0.05))
+                else:
+                    self.score += KILL_SCORE
+                    self.coins += random.randint(COINS_NORMAL_MIN, COINS_NORMAL_MAX)
+                    player.gain_xp(XP_KILL)
+                self.shake = min(10.0, self.shake + (4.0 if is_boss else 2.5))
+            if dead.any():
+                enemies.compact(~dead)
+        bullets.compact(keep)
 
-        for p in self.particles:
-            p.update(dt)
-        self.particles = [p for p in self.particles if p.alive()]
+        self.particles.update(dt)
 
         # Enemies
-        for e in self.enemies:
-            e.update(dt, self.player.pos)
-            if e.type == EnemyType.ZIGZAG:
-                e.zigzag_phase += dt * 4.0
-                perp = V2(-e.vel.y, e.vel.x)
-                if perp.length_squared() > 0:
-                    perp = perp.normalize()
-                    e.pos += perp * math.sin(e.zigzag_phase) * e.speed * 0.5 * dt
-            elif e.type == EnemyType.HOMING:
-                e.shoot_cd -= dt
-                if e.shoot_cd <= 0:
-                    to = self.player.pos - e.pos
-                    dir = to.normalize() if to.length_squared() > 0 else V2(0, 1)
-                    self.bullets.append(
-                        Bullet(
-                            e.pos + dir * (e.radius + 4),
-                            dir * ENEMY_BULLET_SPEED * 0.8,
-                            dmg=1,
-                            from_enemy=True,
-                            homing=True,
-                        )
-                    )
-                    e.shoot_cd = random.uniform(2.0, 3.0)
-            elif e.type == EnemyType.MEGA_BOSS:
-                e.shoot_cd -= dt
-                if e.shoot_cd <= 0:
-                    for i in range(8):
-                        ang = i * (math.tau / 8)
-                        vel = V2(math.cos(ang), math.sin(ang)) * ENEMY_BULLET_SPEED * 0.6
-                        self.bullets.append(Bullet(e.pos, vel, dmg=2, from_enemy=True))
-                    to = self.player.pos - e.pos
-                    dir = to.normalize() if to.length_squared() > 0 else V2(0, 1)
-                    self.bullets.append(Bullet(e.pos, dir * ENEMY_BULLET_SPEED * 0.8, dmg=2, from_enemy=True, homing=True))
-                    e.shoot_cd = random.uniform(1.5, 2.5)
+        ne = enemies.n
+        player_x, player_y = player.pos.x, player.pos.y
+        kind = enemies.kind[:ne]
+        # First enemy touching the player; resolved below, after spawns
+        contact = step_enemies(
+            enemies.px[:ne], enemies.py[:ne], enemies.vx[:ne], enemies.vy[:ne], enemies.speed[:ne],
+            enemies.radius[:ne], enemies.is_boss[:ne], enemies.tier[:ne], enemies.dash_cd[:ne],
+            kind, EnemyType.ZIGZAG.value, enemies.zigzag_phase[:ne],
+            player_x, player_y, float(player.radius), dt, float(WIDTH), float(HEIGHT), self._noise_rows(ne),
+        )
+        plain = (kind == EnemyType.NORMAL.value) | (kind == EnemyType.BOSS.value)
+        armed = (enemies.tier[:ne] >= 2) | (enemies.is_boss[:ne] & (enemies.boss_kind[:ne] == 1))
+        shooters = (kind == EnemyType.HOMING.value) | (kind == EnemyType.MEGA_BOSS.value) | (plain & armed)
+        shoot_cd = enemies.shoot_cd[:ne]
+        shoot_cd[shooters] -= dt
+        for j in np.flatnonzero(shooters & (shoot_cd <= 0)).tolist():
+            etype = int(kind[j])
+            x, y = float(enemies.px[j]), float(enemies.py[j])
+            # Unit aim at the player in plain floats; straight down when on top
+            dx, dy = player_x - x, player_y - y
+            dist = math.hypot(dx, dy)
+            if dist > 0:
+                dx /= dist
+                dy /= dist
+            else:
+                dx, dy = 0.0, 1.0
+            if etype == EnemyType.HOMING.value:
+                offset = float(enemies.radius[j]) + 4
+                speed = ENEMY_BULLET_SPEED * 0.8
+                bullets.spawn(x + dx * offset, y + dy * offset, dx * speed, dy * speed, dmg=1, from_enemy=True, homing=True)
+                shoot_cd[j] = uniform(2.0, 3.0)
+            elif etype == EnemyType.MEGA_BOSS.value:
+                speed = ENEMY_BULLET_SPEED * 0.6
+                bullets.spawn_many(x, y, _RING8_C * speed, _RING8_S * speed, dmg=2, from_enemy=True)
+                speed = ENEMY_BULLET_SPEED * 0.8
+                bullets.spawn(x, y, dx * speed, dy * speed, dmg=2, from_enemy=True, homing=True)
+                shoot_cd[j] = uniform(1.5, 2.5)
             else:
-                if (e.tier >= 2) or (e.is_boss and e.boss_kind == 1):
-                    e.shoot_cd -= dt
-                    if e.shoot_cd <= 0:
-                        to = self.player.pos - e.pos
-                        dir = to.normalize() if to.length_squared() > 0 else V2(0, 1)
-                        dmg = 2 if e.is_boss else 1
-                        self.bullets.append(Bullet(e.pos + dir * (e.radius + 4), dir * ENEMY_BULLET_SPEED, dmg=dmg, from_enemy=True))
-                        e.shoot_cd = random.uniform(1.0, 2.0) if e.is_boss else random.uniform(1.5, 3.0)
+                is_boss = bool(enemies.is_boss[j])
+                offset = float(enemies.radius[j]) + 4
+                dmg = 2 if is_boss else 1
+                bullets.spawn(
+                    x + dx * offset, y + dy * offset, dx * ENEMY_BULLET_SPEED, dy * ENEMY_BULLET_SPEED,
+                    dmg=dmg, from_enemy=True,
+                )
+                shoot_cd[j] = uniform(1.0, 2.0) if is_boss else uniform(1.5, 3.0)
 
         # Spawn logic
         self.spawn_timer -= dt
         if not self._has_boss():
-            if self.spawn_timer <= 0 and len(self.enemies) < self.max_enemies:
-                self.enemies.append(self._spawn_enemy())
+            if self.spawn_timer <= 0 and enemies.n < self.max_enemies:
+                enemies.append(self._spawn_enemy())
                 self.spawn_timer = (
                     ENEMY_SPAWN_COOLDOWN
                     * DIFF_SPAWN_MULT[self.difficulty_idx]
-                    * random.uniform(0.6, 1.2)
+                    * uniform(0.6, 1.2)
                 )
         # Boss timer
         self.boss_timer -= dt
         if self.boss_timer <= 0 and not self._has_boss():
-            self.enemies.append(self._spawn_boss())
+            enemies.append(self._spawn_boss())
+            self.boss_count += 1
             self.boss_timer = 999.0  # wait for kill before next schedule
 
+        # Collisions: orb
+        orb_pos = self.orb.pos
+        dx = player_x - orb_pos.x
+        dy = player_y - orb_pos.y
+        if dx * dx + dy * dy <= _R2_PLAYER_ORB:
+            self.score += ORB_SCORE
+            player.gain_xp(XP_ORB)
+            self.orb = self._spawn_orb()
+            self.shake = min(8.0, self.shake + 4.0)
+
+        # Enemy collision with player. step_enemies already found the first
+        # contact; enemies spawned this frame sit on the screen edge and are
+        # tested from their first step on.
+        if player.iframes <= 0 and contact >= 0:
+            if player.shield_time >= POWERUP_DURATION:
+                player.shield_time = 0.0
+                player.iframes = 0.2
+                self.shake = 8.0
+            else:
+                self.lives -= 1
+                player.iframes = PLAYER_IFRAMES
+                self.shake = 12.0
+                if self.lives <= 0:
+                    self.state = GameState.GAME_OVER
+
+        # Power-up pickups; walk backwards and swap-pop pickups: no list copy, no O(n) remove
+        powerups = self.powerups
+        for i in range(len(powerups) - 1, -1, -1):
+            pu = powerups[i]
+            dx = player_x - pu.pos.x
+            dy = player_y - pu.pos.y
+            if dx * dx + dy * dy <= _R2_PLAYER_PU:
+                self.apply_powerup(pu.kind)
+                powerups[i] = powerups[-1]
+                powerups.pop()
+                self.shake = min(8.0, self.shake + 3.0)
+
+        # Systems that don't need the frame rate run in LOW_TICK steps
+        self._acc_low += dt
+        if self._acc_low >= LOW_TICK:
+            self._tick_low(self._acc_low)
+            self._acc_low = 0.0
+
+    def _tick_low(self, dt: float) -> None:
+        """Difficulty ramp, power-up spawns, effect timers and shake decay.
+
+        Called from update_play about every LOW_TICK seconds with the time
+        accumulated since the previous call.
+        """
         # Difficulty ramp
         self.diff_timer += dt
         if self.diff_timer >= 2.0:
@@ -834,55 +1609,26 @@ class Game:
             self.enemy_speed = min(self.enemy_speed + 6.0, 260.0)
             self.max_enemies = min(self.max_enemies + 1, ENEMY_MAX)
 
-        # Collisions: orb
-        if circle_collision(self.player.pos, self.player.radius, self.orb.pos, self.orb.radius):
-            self.score += ORB_SCORE
-            self.player.gain_xp(XP_ORB)
-            self.orb = self._spawn_orb()
-            self.shake = min(8.0, self.shake + 4.0)
-
-        # Passive score tick
-        self.score += int(20 * dt)
-
-        # Enemy collision with player
-        if self.player.iframes <= 0:
-            for e in self.enemies:
-                if circle_collision(self.player.pos, self.player.radius, e.pos, e.radius):
-                    if self.player.shield_time >= POWERUP_DURATION:
-                        self.player.shield_time = 0.0
-                        self.player.iframes = 0.2
-                        self.shake = 8.0
-                    else:
-                        self.lives -= 1
-                        self.player.iframes = PLAYER_IFRAMES
-                        self.shake = 12.0
-                        if self.lives <= 0:
-                            self.state = GameState.GAME_OVER
-                    break
-
-        # Power-up spawning and pickups
+        # Power-up spawning
         self.pu_spawn_timer -= dt
         if self.pu_spawn_timer <= 0:
             self._spawn_powerup()
             self.pu_spawn_timer = random.uniform(POWERUP_SPAWN_MIN, POWERUP_SPAWN_MAX)
-        for pu in list(self.powerups):
-            if circle_collision(self.player.pos, self.player.radius, pu.pos, POWERUP_RADIUS):
-                self.apply_powerup(pu.kind)
-                self.powerups.remove(pu)
-                self.shake = min(8.0, self.shake + 3.0)
 
-        # Tick effect timers & apply
-        self.rapid_time = max(0.0, self.rapid_time - dt)
-        self.speed_time = max(0.0, self.speed_time - dt)
-        self.spread_time = max(0.0, self.spread_time - dt)
-        self.pierce_time = max(0.0, self.pierce_time - dt)
-        self.player.speed_mult = 1.3 if self.speed_time > 0 else 1.0
+        # Tick effect timers & apply; a fire power-up running out changes the shot
+        timers = self._timers
+        if ((timers[:T_SPEED] > 0.0) & (timers[:T_SPEED] <= dt)).any():
+            self._fire_fn = None
+        np.subtract(timers, dt, out=timers)
+        np.maximum(timers, 0.0, out=timers)
+        self.player.speed_mult = 1.3 if timers[T_SPEED] > 0 else 1.0
 
         # Screen shake decay
         if self.shake > 0:
             self.shake = max(0.0, self.shake - 20.0 * dt)
 
     def apply_powerup(self, kind: PUType) -> None:
+        self._fire_fn = None
         if kind == PUType.RAPID:
             self.rapid_time = POWERUP_DURATION
         elif kind == PUType.SPREAD:
@@ -905,7 +1651,9 @@ class Game:
             if self.coins >= up["cost"]:
                 self.coins -= up["cost"]
                 up["fn"]()
+                self._fire_fn = None
                 up["cost"] = min(999, self._inflate_cost(up["cost"]))
+                self._shop_dirty = True
 
     def _buy_damage(self) -> None:
         self.player.damage += 1
@@ -930,28 +1678,50 @@ class Game:
 
     def update_game_over(self, dt: float) -> None:
         self.starfield.update(dt, V2(0, 10))
+        # The save file is written once when leaving the screen, not per frame
         if self.score > self.high_score:
             self.high_score = self.score
-            self._save()
+            self._hs_dirty = True
+
+    # ---------------------- Text ----------------------------- #
+    def text(self, font: pygame.font.Font, s: str, color: Tuple[int, int, int]) -> pygame.Surface:
+        """Antialiased ``font.render`` memoized by font, string and color.
+
+        Least recently used entries are evicted first, so labels drawn every
+        frame stay cached while changing counters churn through the rest.
+        """
+        cache = self._text_cache
+        key = (id(font), s, color)
+        img = cache.get(key)
+        if img is None:
+            if len(cache) >= TEXT_CACHE_MAX:
+                cache.popitem(last=False)
+            # Match the display format so blits take the fast path
+            img = cache[key] = font.render(s, True, color).convert_alpha()
+        else:
+            cache.move_to_end(key)
+        return img
+
+    def _centered_text(
+        self, font: pygame.font.Font, s: str, color: Tuple[int, int, int], center: Tuple[float, float]
+    ) -> Tuple[Surface, pygame.Rect]:
+        """``(surface, rect)`` pair for ``s`` centred on ``center``, ready for ``blits``."""
+        surf = self.text(font, s, color)
+        return surf, surf.get_rect(center=center)
 
     # ---------------------- Draw Loop ------------------------ #
     def draw_title(self) -> None:
         self.screen.fill(BLACK)
-        self.starfield.draw(self.screen)
-        title = self.font_big.render(TITLE, True, NEON_PINK)
-        sub = self.font.render("SPACE to start — WASD/Arrows to move", True, GREY)
-        hint = self.font_small.render("Auto-shoot, collect coins, B for shop, P to pause.", True, GREY)
-        set_hint = self.font_small.render("S for Settings", True, GREY)
-        self.screen.blit(title, title.get_rect(center=(WIDTH / 2, HEIGHT / 2 - 40)))
-        self.screen.blit(sub, sub.get_rect(center=(WIDTH / 2, HEIGHT / 2 + 10)))
-        self.screen.blit(hint, hint.get_rect(center=(WIDTH / 2, HEIGHT / 2 + 40)))
-        self.screen.blit(set_hint, set_hint.get_rect(center=(WIDTH / 2, HEIGHT / 2 + 70)))
+        # Only the stars move here; the text is redrawn but never changes
+        self._dirty += self.starfield.draw(self.screen)
+        self.screen.blits(self._static_surfs["title"], doreturn=False)
+        self._full_frame = False
 
     def draw_settings(self) -> None:
         self.screen.fill(BLACK)
         self.starfield.draw(self.screen)
-        title = self.font_big.render("SETTINGS", True, NEON_PINK)
-        self.screen.blit(title, title.get_rect(center=(WIDTH / 2, 80)))
+        title = self.text(self.font_big, "SETTINGS", NEON_PINK)
+        self.screen.blit(title, title.get_rect(center=(CX, 80)))
         options = [
             f"Music Volume: {int(self.music_volume * 100)}%",
             f"SFX Volume: {int(self.sfx_volume * 100)}%",
@@ -960,190 +1730,262 @@ class Game:
         y = 160
         for i, text in enumerate(options):
             color = NEON_YELLOW if i == self.settings_index else GREY
-            surf = self.font.render(text, True, color)
-            self.screen.blit(surf, surf.get_rect(center=(WIDTH / 2, y)))
+            surf = self.text(self.font, text, color)
+            self.screen.blit(surf, surf.get_rect(center=(CX, y)))
             y += 40
-        hint = self.font_small.render("Arrows to change, ESC to exit", True, GREY)
-        self.screen.blit(hint, hint.get_rect(center=(WIDTH / 2, HEIGHT - 60)))
+        hint = self.text(self.font_small, "Arrows to change, ESC to exit", GREY)
+        self.screen.blit(hint, hint.get_rect(center=(CX, HEIGHT - 60)))
 
     def draw_hud(self) -> None:
-        score_s = self.font.render(f"Score: {self.score}", True, WHITE)
-        hi_s = self.font.render(f"High: {self.high_score}", True, GREY)
-        coins_s = self.font.render(f"Coins: {self.coins}", True, NEON_YELLOW)
-        kills_s = self.font.render(f"Kills: {self.kills}", True, NEON_GREEN)
-        level_s = self.font.render(f"Level: {self.player.level}", True, NEON_CYAN)
-        xp_s = self.font_small.render(
-            f"XP: {self.player.xp}/{self.player.xp_to_next()}", True, NEON_CYAN
-        )
-        self.screen.blit(score_s, (14, 10))
-        self.screen.blit(hi_s, (14, 38))
-        self.screen.blit(coins_s, (14, 66))
-        self.screen.blit(kills_s, (14, 94))
-        self.screen.blit(level_s, (14, 122))
-        self.screen.blit(xp_s, (14, 150))
+        player = self.player
+        blit = self.screen.blit
+        dirty = self._dirty
+        text = self.text
+        font_small = self.font_small
+        draw_rect = pygame.draw.rect
+        # Stat and badge text is laid out again only when a value it shows
+        # changes; badges count down in whole seconds
+        badge_secs = tuple(int(t) if t > 0 else -1 for t in self._timers.tolist())
+        key = (self.score, self.high_score, self.coins, self.kills, player.level, player.xp, badge_secs)
+        if key != self._hud_key:
+            self._hud_key = key
+            self._hud_items = self._layout_hud_text(badge_secs)
+        dirty += self.screen.blits(self._hud_items)
 
         # Health bar (top-right)
-        hp_label = self.font_small.render("HP", True, WHITE)
+        hp_label = text(font_small, "HP", WHITE)
         hp_label_x = WIDTH - hp_label.get_width() - 14
         hp_label_y = 10
-        self.screen.blit(hp_label, (hp_label_x, hp_label_y))
+        dirty.append(blit(hp_label, (hp_label_x, hp_label_y)))
         bar_x = WIDTH - BAR_WIDTH - 14
         bar_y = hp_label_y + hp_label.get_height() + 4
         ratio = self.lives / LIVES_START
-        pygame.draw.rect(self.screen, NEON_GREEN, (bar_x, bar_y, int(BAR_WIDTH * ratio), BAR_HEIGHT))
-        pygame.draw.rect(self.screen, WHITE, (bar_x, bar_y, BAR_WIDTH, BAR_HEIGHT), 2)
+        dirty.append(draw_rect(self.screen, NEON_GREEN, (bar_x, bar_y, int(BAR_WIDTH * ratio), BAR_HEIGHT)))
+        dirty.append(draw_rect(self.screen, WHITE, (bar_x, bar_y, BAR_WIDTH, BAR_HEIGHT), 2))
 
         # Shield bar below health
-        shield_label = self.font_small.render("Shield", True, WHITE)
+        shield_label = text(font_small, "Shield", WHITE)
         shield_label_x = WIDTH - shield_label.get_width() - 14
         shield_label_y = bar_y + BAR_HEIGHT + 8
-        self.screen.blit(shield_label, (shield_label_x, shield_label_y))
+        dirty.append(blit(shield_label, (shield_label_x, shield_label_y)))
         sy = shield_label_y + shield_label.get_height() + 4
-        shield_ratio = clamp(self.player.shield_time / POWERUP_DURATION, 0.0, 1.0)
-        pygame.draw.rect(self.screen, BLUE, (bar_x, sy, int(BAR_WIDTH * shield_ratio), BAR_HEIGHT))
-        pygame.draw.rect(self.screen, WHITE, (bar_x, sy, BAR_WIDTH, BAR_HEIGHT), 2)
-
+        shield_ratio = clamp(player.shield_time / POWERUP_DURATION, 0.0, 1.0)
+        draw_rect(self.screen, BLUE, (bar_x, sy, int(BAR_WIDTH * shield_ratio), BAR_HEIGHT))
+        dirty.append(draw_rect(self.screen, WHITE, (bar_x, sy, BAR_WIDTH, BAR_HEIGHT), 2))
+
+        prompt = text(font_small, "Press B for Shop", GREY)
+        dirty.append(blit(prompt, (WIDTH - prompt.get_width() - 14, HEIGHT - 28)))
+
+    def _layout_hud_text(self, badge_secs: Tuple[int, ...]) -> List[Tuple[Surface, Tuple[int, int]]]:
+        """``(surface, dest)`` pairs for the HUD stats and power-up badges.
+
+        ``badge_secs`` holds the whole seconds left per ``_timers`` slot, or
+        -1 for a power-up that is not running.
+        """
+        player = self.player
+        text = self.text
+        font = self.font
+        items = [
+            (text(font, f"Score: {self.score}", WHITE), (14, 10)),
+            (text(font, f"High: {self.high_score}", GREY), (14, 38)),
+            (text(font, f"Coins: {self.coins}", NEON_YELLOW), (14, 66)),
+            (text(font, f"Kills: {self.kills}", NEON_GREEN), (14, 94)),
+            (text(font, f"Level: {player.level}", NEON_CYAN), (14, 122)),
+            (text(self.font_small, f"XP: {player.xp}/{player.xp_to_next()}", NEON_CYAN), (14, 150)),
+        ]
         # Power-up badges
-        badges = []
-        if self.rapid_time > 0: badges.append(("Rapid", self.rapid_time))
-        if self.spread_time > 0: badges.append(("Spread", self.spread_time))
-        if self.pierce_time > 0: badges.append(("Pierce", self.pierce_time))
-        if self.speed_time > 0: badges.append(("Speed", self.speed_time))
         x0, y0 = 12, HEIGHT - 28
-        for i, (name, tleft) in enumerate(badges[:6]):
-            label = self.font_small.render(f"{name}:{int(tleft)}s", True, WHITE)
-            self.screen.blit(label, (x0 + i * 130, y0))
-
-        prompt = self.font_small.render("Press B for Shop", True, GREY)
-        self.screen.blit(prompt, (WIDTH - prompt.get_width() - 14, HEIGHT - 28))
+        running = [(name, secs) for name, secs in zip(BADGE_NAMES, badge_secs) if secs >= 0]
+        for i, (name, secs) in enumerate(running):
+            items.append((text(self.font_small, f"{name}:{secs}s", WHITE), (x0 + i * 130, y0)))
+        return items
 
     def draw_shop(self) -> None:
-        panel = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-        panel.fill((0, 0, 0, 200))
-        self.screen.blit(panel, (0, 0))
-        title = self.font_big.render("SHOP", True, NEON_YELLOW)
-        self.screen.blit(title, title.get_rect(center=(WIDTH / 2, 80)))
-        info = self.font_small.render("Press 1–6 to buy, B to close", True, GREY)
-        self.screen.blit(info, info.get_rect(center=(WIDTH / 2, 120)))
+        # Gameplay is paused while the shop is open, so its lines only change
+        # on reset, a purchase or reopening; see _shop_dirty
+        if self._shop_dirty:
+            self._shop_items = self._layout_shop()
+            self._shop_dirty = False
+        self.screen.blits(self._shop_items, doreturn=False)
+
+    def _layout_shop(self) -> List[Tuple[Surface, Tuple[float, float]]]:
+        """``(surface, dest)`` pairs for the shop overlay, panel first."""
+        title = self.text(self.font_big, "SHOP", NEON_YELLOW)
+        info = self.text(self.font_small, "Press 1–6 to buy, B to close", GREY)
+        items = [
+            (self._shop_panel, (0, 0)),
+            (title, title.get_rect(center=(CX, 80))),
+            (info, info.get_rect(center=(CX, 120))),
+        ]
         # List upgrades
         y = 170
         for i, up in enumerate(self.upgrades, start=1):
             name = up["name"]
             cost = up["cost"]
-            line = self.font.render(f"{i}. {name}  —  {cost} coins", True, WHITE)
-            self.screen.blit(line, (WIDTH / 2 - 260, y))
+            line = self.text(self.font, f"{i}. {name}  —  {cost} coins", WHITE)
+            items.append((line, (CX - 260, y)))
             y += 36
-        wallet = self.font.render(f"Coins: {self.coins}", True, NEON_YELLOW)
-        self.screen.blit(wallet, (WIDTH / 2 - 260, y + 10))
+        wallet = self.text(self.font, f"Coins: {self.coins}", NEON_YELLOW)
+        items.append((wallet, (CX - 260, y + 10)))
+        return items
 
     def draw_play(self) -> None:
-        self.screen.fill(BLACK)
-        self.starfield.draw(self.screen)
-        ox = random.uniform(-self.shake, self.shake)
-        oy = random.uniform(-self.shake, self.shake)
-        temp = self.screen.copy()
-        self.orb.draw(temp)
-        for pu in self.powerups:
-            pu.draw(temp)
-        for e in self.enemies:
-            e.draw(temp, self.enemy_sprites)
-        for p in self.particles:
-            p.draw(temp)
-        for b in self.bullets:
-            b.draw(temp, self.bullet_img)
-        self.player.draw(temp, self.t, self.player_img)
-        self.screen.blit(temp, (ox, oy))
+        shake = self.shake
+        ox = oy = 0
+        if shake > 0:
+            # Whole-pixel offsets, as Surface.scroll needs, from the noise table
+            nx, ny, _ = self._noise_rows(1)[0].tolist()
+            ox = int(nx * shake)
+            oy = int(ny * shake)
+        screen = self.screen
+        screen.fill(BLACK)
+        # Scene and HUD rects are collected for run()'s partial display update
+        dirty = self._dirty
+        dirty += self.starfield.draw(screen)
+        dirty.append(self.orb.draw(screen))
+        dirty += screen.blits([pu.blit_item() for pu in self.powerups])
+        dirty += self.enemies.draw(screen, self._atlas, self._enemy_rects)
+        dirty += self.particles.draw(screen, self._atlas, self._particle_rects)
+        dirty += self.bullets.draw(screen, self._atlas, self._bullet_rect, self._enemy_bullet_rect)
+        dirty += self.player.draw(screen, self.t, self.player_img)
+        # A shaken scene or the shop overlay changes the whole screen
+        self._full_frame = bool(ox or oy) or self.shop_open
+        if ox or oy:
+            # Shake the scene in place, then blank the strips it uncovered
+            screen.scroll(ox, oy)
+            if ox:
+                screen.fill(BLACK, (0 if ox > 0 else WIDTH + ox, 0, abs(ox), HEIGHT))
+            if oy:
+                screen.fill(BLACK, (0, 0 if oy > 0 else HEIGHT + oy, WIDTH, abs(oy)))
         self.draw_hud()
         if self.shop_open:
             self.draw_shop()
 
     def draw_game_over(self) -> None:
-        self.draw_play()
-        panel = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-        panel.fill((0, 0, 0, 160))
-        self.screen.blit(panel, (0, 0))
-        over = self.font_big.render("GAME OVER", True, NEON_PINK)
-        s1 = self.font.render(f"Score: {self.score}", True, WHITE)
-        s2 = self.font.render(f"High:  {self.high_score}", True, GREY)
-        s3 = self.font_small.render("Press R to restart, ESC to quit", True, GREY)
-        self.screen.blit(over, over.get_rect(center=(WIDTH / 2, HEIGHT / 2 - 40)))
-        self.screen.blit(s1, s1.get_rect(center=(WIDTH / 2, HEIGHT / 2 + 5)))
-        self.screen.blit(s2, s2.get_rect(center=(WIDTH / 2, HEIGHT / 2 + 35)))
-        self.screen.blit(s3, s3.get_rect(center=(WIDTH / 2, HEIGHT / 2 + 70)))
+        # Nothing in the scene moves once the run is over, so it and the dim
+        # panel are drawn once and the snapshot is reused until reset()
+        if self._gameover_bg is None:
+            self.draw_play()
+            self.screen.blit(self._gameover_panel, (0, 0))
+            self._gameover_bg = self.screen.copy()
+        else:
+            self.screen.blit(self._gameover_bg, (0, 0))
+        # The score lines only change when a run ends or the high score moves
+        key = (self.score, self.high_score)
+        if key != self._go_key:
+            self._go_key = key
+            self._go_items = self._static_surfs["game_over"] + [
+                self._centered_text(self.font, f"Score: {self.score}", WHITE, (CX, CY + 5)),
+                self._centered_text(self.font, f"High:  {self.high_score}", GREY, (CX, CY + 35)),
+            ]
+        self.screen.blits(self._go_items, doreturn=False)
+
+    # ---------------------- Key Handlers --------------------- #
+    _SHOP_KEYS = {
+        pygame.K_1: 0,
+        pygame.K_2: 1,
+        pygame.K_3: 2,
+        pygame.K_4: 3,
+        pygame.K_5: 4,
+        pygame.K_6: 5,
+    }
+
+    def _key_escape(self, key: int) -> None:
+        if self.state == GameState.SETTINGS:
+            self.state = GameState.TITLE
+            self._save()
+        else:
+            self.running = False
+
+    def _key_start(self, key: int) -> None:
+        self._save_high_score()
+        self.reset()
+        self.state = GameState.PLAYING
+
+    def _key_settings(self, key: int) -> None:
+        self.state = GameState.SETTINGS
+
+    def _key_pause(self, key: int) -> None:
+        self.state = GameState.TITLE
+
+    def _key_toggle_shop(self, key: int) -> None:
+        self.shop_open = not self.shop_open
+        self._shop_dirty = True
+
+    def _key_buy(self, key: int) -> None:
+        if self.shop_open:
+            self._buy_if_can(self._SHOP_KEYS[key])
+
+    def _key_restart(self, key: int) -> None:
+        self.reset()
+
+    # (state, key) -> handler, looked up once per KEYDOWN in run()
+    _KEY_HANDLERS = {
+        (GameState.TITLE, pygame.K_ESCAPE): _key_escape,
+        (GameState.PLAYING, pygame.K_ESCAPE): _key_escape,
+        (GameState.GAME_OVER, pygame.K_ESCAPE): _key_escape,
+        (GameState.SETTINGS, pygame.K_ESCAPE): _key_escape,
+        (GameState.TITLE, pygame.K_SPACE): _key_start,
+        (GameState.TITLE, pygame.K_s): _key_settings,
+        (GameState.PLAYING, pygame.K_p): _key_pause,
+        (GameState.PLAYING, pygame.K_b): _key_toggle_shop,
+        (GameState.PLAYING, pygame.K_r): _key_restart,
+        (GameState.GAME_OVER, pygame.K_r): _key_start,
+        **dict.fromkeys(((GameState.PLAYING, key) for key in _SHOP_KEYS), _key_buy),
+    }
 
     # ---------------------- Main Loop ------------------------ #
     def run(self) -> None:
+        get_events = pygame.event.get
+        clear_events = pygame.event.clear
+        exposes = (pygame.WINDOWEXPOSED, pygame.VIDEOEXPOSE)
+        wanted = (pygame.QUIT, pygame.KEYDOWN) + exposes
+        handlers = self._KEY_HANDLERS
+        states = self._state_table
         while self.running:
-            dt = self.clock.tick(FPS) / 1000.0
+            dt = self.clock.tick(FPS if self.state == GameState.PLAYING else MENU_FPS) / 1000.0
             self.t += dt
 
-            events = pygame.event.get()
+            # Only the event types the game reads become Event objects; the
+            # rest of what this pump queued (mouse motion etc.) is flushed
+            events = get_events(wanted)
+            clear_events(pump=False)
+            exposed = False
             for event in events:
-                if event.type == pygame.QUIT:
+                if event.type in exposes:
+                    exposed = True
+                elif event.type == pygame.QUIT:
                     self.running = False
                 elif event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_ESCAPE:
-                        if self.state == GameState.SETTINGS:
-                            self.state = GameState.TITLE
-                            self._save()
-                        else:
-                            self.running = False
-                    if self.state == GameState.TITLE:
-                        if event.key == pygame.K_SPACE:
-                            self.reset()
-                            self.state = GameState.PLAYING
-                        elif event.key == pygame.K_s:
-                            self.state = GameState.SETTINGS
-                    elif self.state == GameState.PLAYING:
-                        if event.key == pygame.K_p:
-                            self.state = GameState.TITLE
-                        if event.key == pygame.K_b:
-                            self.shop_open = not self.shop_open
-                        if self.shop_open:
-                            if event.key in (
-                                pygame.K_1,
-                                pygame.K_2,
-                                pygame.K_3,
-                                pygame.K_4,
-                                pygame.K_5,
-                                pygame.K_6,
-                            ):
-                                idx = {
-                                    pygame.K_1: 0,
-                                    pygame.K_2: 1,
-                                    pygame.K_3: 2,
-                                    pygame.K_4: 3,
-                                    pygame.K_5: 4,
-                                    pygame.K_6: 5,
-                                }[event.key]
-                                self._buy_if_can(idx)
-                        if event.key == pygame.K_r:
-                            self.reset()
-                    elif self.state == GameState.GAME_OVER:
-                        if event.key == pygame.K_r:
-                            self.reset()
-                            self.state = GameState.PLAYING
-
-            if self.state == GameState.TITLE:
-                self.update_title(dt)
-            elif self.state == GameState.PLAYING:
-                self.update_play(dt)
-            elif self.state == GameState.SETTINGS:
-                self.update_settings(dt, events)
-            else:
-                self.update_game_over(dt)
-
-            if self.state == GameState.TITLE:
-                self.draw_title()
-            elif self.state == GameState.PLAYING:
-                self.draw_play()
-            elif self.state == GameState.SETTINGS:
-                self.draw_settings()
+                    handler = handlers.get((self.state, event.key))
+                    if handler is not None:
+                        handler(self, event.key)
+
+            # The draw is looked up after the update, which may change state
+            states[self.state][0](dt, events)
+            if self.state == GameState.GAME_OVER and self._gameover_bg is not None and not exposed:
+                # The game-over screen is already up and nothing on it moves;
+                # it is only presented again when the window needs repainting
+                continue
+            states[self.state][1]()
+
+            # Gameplay and title frames push only what was drawn this frame or
+            # the last (which erases it). Frames that repaint everything flip,
+            # and so does the one after, or the first in a new state, since
+            # their rects don't cover that repaint. So does any frame after
+            # the window was exposed, as the whole of it needs repainting.
+            state = self.state
+            full = self._full_frame or state not in (GameState.PLAYING, GameState.TITLE)
+            if exposed or full or self._last_full or state != self._last_state:
+                pygame.display.flip()
             else:
-                self.draw_game_over()
-
-            pygame.display.flip()
+                pygame.display.update(self._last_dirty + self._dirty)
+            self._last_full = full
+            self._last_state = state
+            self._last_dirty, self._dirty = self._dirty, self._last_dirty
+            self._dirty.clear()
 
+        self._save_high_score()
         pygame.quit()
 
 